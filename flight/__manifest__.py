@@ -9,9 +9,12 @@
         See Flight Operations Management (flight_ops) module for user interface and business logic.
 
         === Aerodrome Data ===
-            Because of the large size of the aerodrome data, it is not loaded by default. To load the data, download the CSV
-            file from https://raw.githubusercontent.com/smartops-aero/smartops-odoo-flight/16.0/flight/data/flight.aerodrome.csv
-            and import it using the Flights -> Configuration -> Aerodromes -> Favorites -> Import records function.
+            Because of the large size of the aerodrome data, it is not loaded by default. Aerodromes referenced by their
+            ICAO or IATA code in imports, data syncs or exact code searches are created on demand from the bundled
+            flight/data/flight.aerodrome.idx lookup file, generated from flight/data/flight.aerodrome.csv.
+            To load the whole dataset, use
+            Flights -> Configuration -> Import Aerodromes, which bulk loads the bundled
+            flight/data/flight.aerodrome.csv (or an uploaded file in the same format) in a few seconds.
     """,
     "author": "Apexive Solutions LLC",
     "website": "https://github.com/OCA/server-env",
@@ -34,6 +37,8 @@
         "views/flight_views.xml",
         "views/aircraft_views.xml",
         "views/aerodrome_views.xml",
+        "wizard/flight_aerodrome_import_wizard_views.xml",
+        "wizard/flight_lock_wizard_views.xml",
         "views/menu.xml",
         "data/flight.aircraft.class.csv",
         "data/flight.aircraft.model.tag.csv",
@@ -1,9 +1,35 @@
 #!/usr/bin/env python3
+"""
+Generate flight.aerodrome.csv from the airportsdata package.
+
+Besides the full dataset, the script writes:
+
+- flight.aerodrome.manifest.csv: the sha256 of every row, keyed by ICAO code,
+  used as the baseline of the next run;
+- flight.aerodrome.csv.sha256: the checksum of the full dataset;
+- flight.aerodrome.idx: the compact lookup file used to create aerodromes on
+  demand, see tools/aerodrome_index.py;
+- flight.aerodrome.delta.csv: rows added, changed or removed since the previous
+  dataset, with an extra ``action`` column. The delta can be imported with the
+  Import Aerodromes wizard or ``flight.aerodrome._load_aerodrome_csv()``, which
+  only touches the rows listed in it.
+
+The previous dataset is read from the manifest when it exists, otherwise from
+the CSV about to be overwritten.
+"""
+
+import argparse
 import csv
+import hashlib
+import os
+import sys
 
 import airportsdata
 
-airports = airportsdata.load()
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tools")
+)
+import aerodrome_index  # noqa: E402
 
 fieldnames = [
     "id",
@@ -21,11 +47,31 @@ fieldnames = [
 ]
 
 
-with open("flight.aerodrome.csv", "w", newline="", encoding="utf-8") as csvfile:
-    writer = csv.DictWriter(csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
-    writer.writeheader()
+def row_digest(row):
+    values = ["" if row.get(name) is None else str(row[name]) for name in fieldnames]
+    return hashlib.sha256("\x1f".join(values).encode("utf-8")).hexdigest()
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
 
-    for aerodrome in airports.values():
+
+def load_previous_digests(manifest_path, csv_path):
+    if os.path.exists(manifest_path):
+        with open(manifest_path, newline="", encoding="utf-8") as f:
+            return {row["icao"]: row["sha256"] for row in csv.DictReader(f)}
+    if os.path.exists(csv_path):
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            return {row["icao"]: row_digest(row) for row in csv.DictReader(f)}
+    return {}
+
+
+def generate_rows():
+    for aerodrome in airportsdata.load().values():
         iso_country = aerodrome.pop("country").lower()
         if iso_country == "gb":
             iso_country = "uk"
@@ -35,5 +81,64 @@ with open("flight.aerodrome.csv", "w", newline="", encoding="utf-8") as csvfile:
         aerodrome["elevation"] = int(aerodrome["elevation"])
         aerodrome["longitude"] = aerodrome.pop("lon")
         aerodrome["latitude"] = aerodrome.pop("lat")
+        yield aerodrome
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="flight.aerodrome.csv")
+    parser.add_argument("--manifest", default="flight.aerodrome.manifest.csv")
+    parser.add_argument("--delta", default="flight.aerodrome.delta.csv")
+    parser.add_argument("--index", default="flight.aerodrome.idx")
+    args = parser.parse_args()
+
+    previous = load_previous_digests(args.manifest, args.output)
+    digests = {}
+    changes = {"add": 0, "change": 0, "remove": 0}
+
+    with (
+        open(args.output, "w", newline="", encoding="utf-8") as csvfile,
+        open(args.delta, "w", newline="", encoding="utf-8") as deltafile,
+    ):
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
+        writer.writeheader()
+        delta_writer = csv.DictWriter(
+            deltafile, fieldnames=fieldnames + ["action"], quoting=csv.QUOTE_ALL
+        )
+        delta_writer.writeheader()
+
+        for aerodrome in generate_rows():
+            writer.writerow(aerodrome)
+
+            digest = digests[aerodrome["icao"]] = row_digest(aerodrome)
+            previous_digest = previous.get(aerodrome["icao"])
+            if previous_digest == digest:
+                continue
+            action = "add" if previous_digest is None else "change"
+            delta_writer.writerow(dict(aerodrome, action=action))
+            changes[action] += 1
+
+        for icao in sorted(previous.keys() - digests.keys()):
+            delta_writer.writerow({"icao": icao, "action": "remove"})
+            changes["remove"] += 1
+
+    with open(args.manifest, "w", newline="", encoding="utf-8") as manifestfile:
+        manifest_writer = csv.writer(manifestfile)
+        manifest_writer.writerow(["icao", "sha256"])
+        manifest_writer.writerows(sorted(digests.items()))
+
+    with open(args.output + ".sha256", "w", encoding="utf-8") as checksumfile:
+        checksumfile.write(
+            f"{file_digest(args.output)}  {os.path.basename(args.output)}\n"
+        )
+
+    aerodrome_index.build_index(args.output, args.index)
+
+    print(
+        f"{len(digests)} aerodromes: {changes['add']} added, "
+        f"{changes['change']} changed, {changes['remove']} removed"
+    )
+
 
-        writer.writerow(aerodrome)
+if __name__ == "__main__":
+    main()
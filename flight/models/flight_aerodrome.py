@@ -1,23 +1,55 @@
 # Copyright 2024 Apexive <https://apexive.com/>
 # License MIT (https://opensource.org/licenses/MIT).
-from odoo import api, fields, models
+import csv
+import io
+import logging
+import re
+
+import psycopg2
+
+from odoo import api, fields, models, tools
+from odoo.modules.module import get_module_resource
 
 from odoo.addons.base.models.res_partner import _tz_get
 
+from ..tools.aerodrome_index import open_index
+from ..tools.geo import KDTree
+
+_logger = logging.getLogger(__name__)
+
+# Full ICAO or IATA code, the only input aerodromes are materialized for
+AERODROME_CODE_RE = re.compile(r"^(?:[A-Z0-9]{4}|[A-Z]{3})$")
+
+# Columns of flight/data/flight.aerodrome.csv staged by the bulk loader, the
+# country is kept as an external id and resolved in SQL.
+AERODROME_CSV_COLUMNS = [
+    "icao",
+    "iata",
+    "name",
+    "city",
+    "municipality",
+    "country_id/id",
+    "elevation",
+    "latitude",
+    "longitude",
+    "tz",
+    "lid",
+]
+
 
 class FlightAerodrome(models.Model):
     _name = "flight.aerodrome"
     _description = "Aerodrome"
     _rec_name = "icao"
-    _rec_names_search = ["icao", "iata"]
+    _rec_names_search = ["icao", "iata", "name"]
 
     _inherit = ["mail.thread"]
 
-    name = fields.Char(index=True)
+    name = fields.Char(index="trigram")
 
-    icao = fields.Char("ICAO identifier", index=True, required=True)
-    iata = fields.Char("IATA identifier", index=True)
-    lid = fields.Char("FAA identifier")
+    icao = fields.Char("ICAO identifier", index="trigram", required=True)
+    iata = fields.Char("IATA identifier", index="trigram")
+    lid = fields.Char("FAA identifier", index=True)
 
     city = fields.Char()
     municipality = fields.Char()
@@ -48,3 +80,386 @@ class FlightAerodrome(models.Model):
                     ],
                 )
             )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        aerodromes = super().create(vals_list)
+        self.clear_caches()
+        return aerodromes
+
+    def write(self, vals):
+        result = super().write(vals)
+        if {"icao", "iata", "lid", "latitude", "longitude"} & set(vals):
+            self.clear_caches()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.clear_caches()
+        return result
+
+    @api.model
+    @tools.ormcache("code")
+    def _resolve_code_id(self, code):
+        """Exact ICAO, then IATA, then FAA identifier match, cached per worker"""
+        aerodromes = self.sudo().search_read(
+            ["|", "|", ("icao", "=", code), ("iata", "=", code), ("lid", "=", code)],
+            ["icao", "iata", "lid"],
+        )
+        for field_name in ("icao", "iata", "lid"):
+            for aerodrome in aerodromes:
+                if aerodrome[field_name] == code:
+                    return aerodrome["id"]
+        return False
+
+    @api.model
+    def resolve_codes(self, codes, materialize=True):
+        """
+        Map aerodrome codes to ids for ingestion code.
+
+        Lookups are served from an in-process cache invalidated when
+        aerodromes are created, deleted or change their codes.
+
+        :param codes: iterable of ICAO, IATA or FAA identifiers
+        :param materialize: create aerodromes missing from the database from
+            the bundled lookup file, see get_by_codes
+        :return: ``{code: id}``, unknown codes map to False
+        """
+        result = {}
+        missing = []
+        for code in codes:
+            if not code or code in result:
+                continue
+            result[code] = self._resolve_code_id(code.strip().upper())
+            if not result[code]:
+                missing.append(code)
+        if missing and materialize and self.get_by_codes(missing):
+            for code in missing:
+                result[code] = self._resolve_code_id(code.strip().upper())
+        return result
+
+    @api.model
+    @tools.ormcache()
+    def _get_spatial_index(self):
+        """
+        k-d tree of the ICAO codes of the aerodromes with coordinates, built
+        once per worker from the bundled dataset, so that aerodromes not
+        created yet are found too, and from the database, which takes
+        precedence for the aerodromes it contains
+        """
+        coordinates = {}
+        index = self._get_aerodrome_index()
+        for row in index.records() if index else ():
+            latitude = float(row["latitude"] or 0.0)
+            longitude = float(row["longitude"] or 0.0)
+            if latitude or longitude:
+                coordinates[row["icao"]] = (latitude, longitude)
+        for row in self.sudo().search_read(
+            ["|", ("latitude", "!=", 0), ("longitude", "!=", 0)],
+            ["icao", "latitude", "longitude"],
+        ):
+            coordinates[row["icao"]] = (row["latitude"], row["longitude"])
+        return KDTree(
+            (latitude, longitude, icao)
+            for icao, (latitude, longitude) in coordinates.items()
+        )
+
+    @api.model
+    def find_nearest(self, latitude, longitude, k=1, radius=None):
+        """
+        Return the ``k`` aerodromes closest to a position, ordered by
+        great-circle distance.
+
+        The whole bundled dataset is searched and the aerodromes found are
+        created on the fly with get_by_codes. For users without create access
+        on aerodromes, those not in the database yet are left out, so fewer
+        than ``k`` aerodromes may be returned.
+
+        :param radius: optional maximum distance in nautical miles
+        """
+        nearest = self._get_spatial_index().nearest(
+            latitude, longitude, k=k, radius_nm=radius
+        )
+        codes = [icao for icao, _distance in nearest]
+        aerodromes = {
+            aerodrome.icao.upper(): aerodrome.id
+            for aerodrome in self.get_by_codes(codes)
+        }
+        return self.browse(
+            [aerodromes[code.upper()] for code in codes if code.upper() in aerodromes]
+        )
+
+    @api.model
+    def _name_search(
+        self, name, args=None, operator="ilike", limit=100, name_get_uid=None
+    ):
+        # Exact lookups only, autocompletion must not create aerodromes for
+        # every partial code typed
+        if (
+            name
+            and operator in ("=", "=ilike")
+            and AERODROME_CODE_RE.match(name.strip().upper())
+        ):
+            self.get_by_codes([name])
+        return super()._name_search(
+            name, args=args, operator=operator, limit=limit, name_get_uid=name_get_uid
+        )
+
+    @api.model
+    def _get_aerodrome_index(self):
+        path = get_module_resource("flight", "data", "flight.aerodrome.idx")
+        return open_index(path) if path else None
+
+    @api.model
+    def get_by_codes(self, codes):
+        """
+        Return the aerodromes matching ICAO or IATA codes.
+
+        Codes that are not in the database yet are looked up in the bundled
+        flight.aerodrome.idx file and the matching aerodromes are created on
+        the fly, so that only the aerodromes actually used are stored. Nothing
+        is created for users without create access on aerodromes.
+        """
+        codes = {code.strip().upper() for code in codes if code and code.strip()}
+        if not codes:
+            return self.browse()
+        Aerodrome = self.sudo()
+        aerodromes = Aerodrome.search(
+            ["|", ("icao", "in", list(codes)), ("iata", "in", list(codes))]
+        )
+        missing = (
+            codes - set(aerodromes.mapped("icao")) - set(aerodromes.mapped("iata"))
+        )
+
+        if missing and not self.check_access_rights("create", raise_exception=False):
+            missing = set()
+        index = self._get_aerodrome_index() if missing else None
+        if index:
+            rows = {}
+            for code in missing:
+                row = index.lookup(code)
+                if row:
+                    rows[row["icao"]] = row
+            # A code may resolve to an ICAO stored without its IATA code
+            existing = Aerodrome.search([("icao", "in", list(rows))])
+            aerodromes |= existing
+            existing_icao = set(existing.mapped("icao"))
+            vals_list = [
+                self._prepare_index_values(row)
+                for icao, row in rows.items()
+                if icao not in existing_icao
+            ]
+            if vals_list:
+                aerodromes |= self.with_context(
+                    tracking_disable=True, mail_create_nolog=True
+                ).create(vals_list)
+        return self.browse(aerodromes.ids)
+
+    @api.model
+    def _prepare_index_values(self, row):
+        country = (
+            self.env.ref(row["country_id/id"], raise_if_not_found=False)
+            if row["country_id/id"]
+            else None
+        )
+        return {
+            "icao": row["icao"],
+            "iata": row["iata"] or False,
+            "name": row["name"] or False,
+            "city": row["city"] or False,
+            "municipality": row["municipality"] or False,
+            "country_id": country.id if country else False,
+            "elevation": int(float(row["elevation"] or 0)),
+            "latitude": float(row["latitude"] or 0.0),
+            "longitude": float(row["longitude"] or 0.0),
+            "tz": row["tz"] or False,
+            "lid": row["lid"] or False,
+        }
+
+    @api.model
+    def _load_aerodrome_csv(self, csv_file=None, chunk_size=5000):
+        """
+        Bulk load aerodromes from a CSV in the format of flight.aerodrome.csv.
+
+        Rows are streamed in chunks, staged with COPY and upserted on the ICAO
+        code with a single statement per chunk. Records are written directly
+        in SQL, bypassing chatter and tracking.
+
+        Delta files produced by data/generate_aerodrome_csv.py carry an extra
+        ``action`` column; their ``remove`` rows delete the aerodrome unless it
+        is still referenced, in which case it is kept and logged.
+
+        Can be called from an Odoo shell::
+
+            env["flight.aerodrome"]._load_aerodrome_csv()
+            env.cr.commit()
+
+        :param csv_file: text file object, defaults to the CSV bundled with
+            the module; paths are not accepted so that no server file can be
+            read on behalf of a client
+        :param chunk_size: number of rows staged per statement
+        :return: dict with ``inserted``, ``updated``, ``unchanged`` and
+            ``removed`` counts
+        """
+        if csv_file is None:
+            path = get_module_resource("flight", "data", "flight.aerodrome.csv")
+            with open(path, newline="", encoding="utf-8") as f:
+                return self._load_aerodrome_rows(csv.DictReader(f), chunk_size)
+        return self._load_aerodrome_rows(csv.DictReader(csv_file), chunk_size)
+
+    @api.model
+    def _load_aerodrome_rows(self, rows, chunk_size=5000):
+        self.check_access_rights("create")
+        self.check_access_rights("write")
+        self.flush_model()
+
+        self.env.cr.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS flight_aerodrome_staging (
+                icao varchar,
+                iata varchar,
+                name varchar,
+                city varchar,
+                municipality varchar,
+                country_xmlid varchar,
+                elevation varchar,
+                latitude varchar,
+                longitude varchar,
+                tz varchar,
+                lid varchar
+            ) ON COMMIT DROP
+            """
+        )
+
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        chunk = []
+        to_remove = []
+        updated_ids = []
+        for row in rows:
+            icao = (row.get("icao") or "").strip()
+            if not icao:
+                continue
+            if row.get("action") == "remove":
+                to_remove.append(icao)
+                continue
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                self._upsert_aerodrome_chunk(chunk, counts, updated_ids)
+                chunk = []
+        if chunk:
+            self._upsert_aerodrome_chunk(chunk, counts, updated_ids)
+
+        self.invalidate_model()
+        self.clear_caches()
+        self._recompute_flight_distances(updated_ids)
+        if to_remove:
+            counts["removed"] = self._remove_aerodromes(to_remove)
+        return counts
+
+    @api.model
+    def _recompute_flight_distances(self, aerodrome_ids):
+        """Recompute the distance of the flights of aerodromes updated in SQL"""
+        if not aerodrome_ids:
+            return
+        Flight = self.env["flight.flight"].sudo()
+        flights = Flight.search(
+            [
+                "|",
+                ("departure_id", "in", aerodrome_ids),
+                ("arrival_id", "in", aerodrome_ids),
+            ]
+        )
+        self.env.add_to_compute(Flight._fields["distance_nm"], flights)
+        flights.flush_recordset(["distance_nm"])
+
+    @api.model
+    def _remove_aerodromes(self, icao_codes):
+        removed = 0
+        for aerodrome in self.search([("icao", "in", icao_codes)]):
+            try:
+                with self.env.cr.savepoint():
+                    aerodrome.unlink()
+                removed += 1
+            except psycopg2.IntegrityError:
+                _logger.warning(
+                    "Aerodrome %s removed from the dataset is still in use, keeping it",
+                    aerodrome.icao,
+                )
+        return removed
+
+    @api.model
+    def _upsert_aerodrome_chunk(self, rows, counts, updated_ids):
+        cr = self.env.cr
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(
+                [(row.get(column) or "").strip() for column in AERODROME_CSV_COLUMNS]
+            )
+        buffer.seek(0)
+
+        cr.execute("TRUNCATE flight_aerodrome_staging")
+        cr.copy_expert(
+            "COPY flight_aerodrome_staging FROM STDIN WITH (FORMAT csv)", buffer
+        )
+        cr.execute(
+            """
+            INSERT INTO flight_aerodrome (
+                icao, iata, name, city, municipality, country_id, elevation,
+                latitude, longitude, tz, lid,
+                create_uid, create_date, write_uid, write_date
+            )
+            SELECT DISTINCT ON (s.icao)
+                s.icao, s.iata, s.name, s.city, s.municipality, imd.res_id,
+                round(s.elevation::numeric)::integer,
+                s.latitude::numeric, s.longitude::numeric, s.tz, s.lid,
+                %(uid)s, now() at time zone 'UTC',
+                %(uid)s, now() at time zone 'UTC'
+            FROM flight_aerodrome_staging s
+            LEFT JOIN ir_model_data imd
+                ON imd.model = 'res.country'
+                AND imd.module = split_part(s.country_xmlid, '.', 1)
+                AND imd.name = split_part(s.country_xmlid, '.', 2)
+            ORDER BY s.icao
+            ON CONFLICT (icao) DO UPDATE SET
+                iata = EXCLUDED.iata,
+                name = EXCLUDED.name,
+                city = EXCLUDED.city,
+                municipality = EXCLUDED.municipality,
+                country_id = EXCLUDED.country_id,
+                elevation = EXCLUDED.elevation,
+                latitude = EXCLUDED.latitude,
+                longitude = EXCLUDED.longitude,
+                tz = EXCLUDED.tz,
+                lid = EXCLUDED.lid,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+            WHERE (
+                flight_aerodrome.iata, flight_aerodrome.name, flight_aerodrome.city,
+                flight_aerodrome.municipality, flight_aerodrome.country_id,
+                flight_aerodrome.elevation, flight_aerodrome.latitude,
+                flight_aerodrome.longitude, flight_aerodrome.tz, flight_aerodrome.lid
+            ) IS DISTINCT FROM (
+                EXCLUDED.iata, EXCLUDED.name, EXCLUDED.city,
+                EXCLUDED.municipality, EXCLUDED.country_id,
+                EXCLUDED.elevation, EXCLUDED.latitude,
+                EXCLUDED.longitude, EXCLUDED.tz, EXCLUDED.lid
+            )
+            RETURNING id, (xmax = 0) AS inserted
+            """,
+            {"uid": self.env.uid},
+        )
+        results = cr.fetchall()
+        chunk_updated_ids = [
+            aerodrome_id for aerodrome_id, is_insert in results if not is_insert
+        ]
+        updated_ids.extend(chunk_updated_ids)
+        updated = len(chunk_updated_ids)
+        inserted = len(results) - updated
+
+        cr.execute("SELECT count(DISTINCT icao) FROM flight_aerodrome_staging")
+        staged = cr.fetchone()[0]
+
+        counts["inserted"] += inserted
+        counts["updated"] += updated
+        counts["unchanged"] += staged - inserted - updated
@@ -1,4 +1,9 @@
-from odoo import fields, models
+from collections import defaultdict
+
+from odoo import _, api, fields, models
+from odoo.tools import split_every
+
+from ..tools.geo import distance_nm
 
 
 class FlightFlight(models.Model):
@@ -6,6 +11,7 @@ class FlightFlight(models.Model):
     _description = "Flight"
     _inherit = ["mail.thread", "mail.activity.mixin", "flight.lock.mixin"]
     _order = "date desc, id desc"
+    _rec_name = "name"
 
     date = fields.Date(
         "Flight Date", help="Scheduled date of flight", required=True, tracking=True
@@ -14,14 +20,98 @@ class FlightFlight(models.Model):
     departure_id = fields.Many2one("flight.aerodrome", required=True, tracking=True)
     arrival_id = fields.Many2one("flight.aerodrome", required=True, tracking=True)
     locked = fields.Boolean(default=False, tracking=True)
+    name = fields.Char(compute="_compute_name", store=True, index="trigram")
+    distance_nm = fields.Float(
+        "Distance (NM)",
+        compute="_compute_distance_nm",
+        store=True,
+        digits=(16, 1),
+        help="Great-circle distance between the departure and arrival aerodromes",
+    )
 
-    def name_get(self):
-        result = []
+    @api.depends(
+        "departure_id.latitude",
+        "departure_id.longitude",
+        "arrival_id.latitude",
+        "arrival_id.longitude",
+    )
+    def _compute_distance_nm(self):
+        # Read the coordinates of all aerodromes involved at once
+        coordinates = {
+            aerodrome.id: (aerodrome.latitude, aerodrome.longitude)
+            for aerodrome in self.departure_id | self.arrival_id
+        }
+        for flight in self:
+            departure = coordinates.get(flight.departure_id.id)
+            arrival = coordinates.get(flight.arrival_id.id)
+            if departure and arrival and any(departure) and any(arrival):
+                flight.distance_nm = distance_nm(*departure, *arrival)
+            else:
+                flight.distance_nm = 0.0
+
+    @api.depends(
+        "date", "aircraft_id.registration", "departure_id.icao", "arrival_id.icao"
+    )
+    def _compute_name(self):
+        # Related records are prefetched for the whole recordset
         for record in self:
-            name = f"{record.date} / {record.aircraft_id.registration}: {record.departure_id.icao} - {record.arrival_id.icao}"
-            result.append((record.id, name))
-        return result
+            record.name = f"{record.date} / {record.aircraft_id.registration}: {record.departure_id.icao} - {record.arrival_id.icao}"
+
+    def name_get(self):
+        return [(record.id, record.name) for record in self]
 
     def toggle_locked(self):
         self.ensure_one()
         self.write({"locked": not self.locked})
+
+    def set_locked(self, locked=True, batch_size=1000):
+        """
+        Lock or unlock the flights with set-based updates in batches.
+
+        Unlike ``write``, no tracking message is posted per flight: a single
+        summary is posted on each aircraft involved. Meant for period close.
+
+        :return: number of flights whose lock state changed
+        """
+        self.check_access_rights("write")
+        self.check_access_rule("write")
+        self.flush_recordset(["locked"])
+        changed = defaultdict(list)
+        for ids in split_every(batch_size, self.ids):
+            self.env.cr.execute(
+                """
+                UPDATE flight_flight
+                   SET locked = %s,
+                       write_uid = %s,
+                       write_date = (now() at time zone 'UTC')
+                 WHERE id IN %s
+                   AND locked IS DISTINCT FROM %s
+             RETURNING aircraft_id, date
+                """,
+                [locked, self.env.uid, tuple(ids), locked],
+            )
+            for aircraft_id, date in self.env.cr.fetchall():
+                changed[aircraft_id].append(date)
+        self.invalidate_recordset(["locked", "write_uid", "write_date"])
+
+        message = _("%(count)s flights from %(start)s to %(end)s locked")
+        if not locked:
+            message = _("%(count)s flights from %(start)s to %(end)s unlocked")
+        for aircraft_id, dates in changed.items():
+            self.env["flight.aircraft"].browse(aircraft_id).message_post(
+                body=message
+                % {"count": len(dates), "start": min(dates), "end": max(dates)}
+            )
+        return sum(len(dates) for dates in changed.values())
+
+    @api.model
+    def lock_period(self, date_from, date_to, aircraft_ids=None, locked=True):
+        """Lock (or unlock) the flights of a period, optionally of some aircraft"""
+        domain = [
+            ("date", ">=", date_from),
+            ("date", "<=", date_to),
+            ("locked", "!=", locked),
+        ]
+        if aircraft_ids:
+            domain.append(("aircraft_id", "in", aircraft_ids))
+        return self.search(domain, order="id").set_locked(locked)
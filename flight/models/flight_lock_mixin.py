@@ -8,28 +8,53 @@ class FlightLockMixin(models.AbstractModel):
 
     def _is_locked(self):
         self.ensure_one()
-        if hasattr(self, "locked") and self.locked:
-            return True
-        elif hasattr(self, "flight_id") and self.flight_id.locked:
-            return True
-        return False
+        return bool(self._get_locked_flights(self._get_lock_flight_ids()))
+
+    def _get_lock_flight_ids(self):
+        """Ids of the flights whose lock applies to the records"""
+        if "locked" in self._fields:
+            return set(self.ids)
+        elif "flight_id" in self._fields:
+            # One query for the whole recordset
+            return set(self.flight_id.ids)
+        return set()
+
+    @api.model
+    def _get_lock_flight_ids_from_vals(self, vals_list):
+        """Ids of the flights whose lock applies to the records to create"""
+        if "locked" in self._fields or "flight_id" not in self._fields:
+            return set()
+        default = self.env.context.get("default_flight_id")
+        return {vals.get("flight_id", default) for vals in vals_list} - {False, None}
+
+    @api.model
+    def _get_locked_flights(self, flight_ids):
+        """Return a locked flight among ``flight_ids``, in a single query"""
+        if not flight_ids:
+            return self.env["flight.flight"]
+        return (
+            self.env["flight.flight"]
+            .sudo()
+            .search([("id", "in", list(flight_ids)), ("locked", "=", True)], limit=1)
+        )
 
     @api.model_create_multi
     def create(self, vals_list):
-        for record in self:
-            if record._is_locked():
-                raise UserError(_("You cannot create records for a locked flight."))
+        if self._get_locked_flights(self._get_lock_flight_ids_from_vals(vals_list)):
+            raise UserError(_("You cannot create records for a locked flight."))
         return super().create(vals_list)
 
     def write(self, vals):
         if len(vals) > 1 or "locked" not in vals:
-            for record in self:
-                if record._is_locked():
-                    raise UserError(_("You cannot modify locked flights."))
+            flight_ids = self._get_lock_flight_ids()
+            if "flight_id" in self._fields and vals.get("flight_id"):
+                # Nor move records to a locked flight
+                flight_ids.add(vals["flight_id"])
+            if self._get_locked_flights(flight_ids):
+                raise UserError(_("You cannot modify locked flights."))
         return super().write(vals)
 
     def unlink(self):
-        for record in self:
-            if record._is_locked():
-                raise UserError(_("You cannot delete records of a locked flight."))
+        if self._get_locked_flights(self._get_lock_flight_ids()):
+            raise UserError(_("You cannot delete records of a locked flight."))
         return super().unlink()
@@ -0,0 +1,3 @@
+from . import aerodrome_index
+from . import geo
+from . import timezone
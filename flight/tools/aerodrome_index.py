@@ -0,0 +1,149 @@
+# Copyright 2024 Apexive <https://apexive.com/>
+# License MIT (https://opensource.org/licenses/MIT).
+"""
+Compact, memory-mapped aerodrome lookup file.
+
+The file bundles the whole aerodrome dataset so that aerodromes can be created
+on demand instead of importing all of them. Layout, little endian:
+
+- header: magic, slot count, record count;
+- slots: open addressing hash table of ``(key, record offset + 1)`` pairs, keys
+  are ``I:<ICAO>`` or ``A:<IATA>`` padded to 6 bytes, an offset of 0 marks an
+  empty slot;
+- records: one tab separated UTF-8 line per aerodrome with RECORD_FIELDS.
+
+This module does not depend on Odoo, it is also used by
+data/generate_aerodrome_csv.py to build the file.
+"""
+
+import csv
+import functools
+import mmap
+import os
+import struct
+import zlib
+
+MAGIC = b"FLTAIDX1"
+HEADER = struct.Struct("<8sII")
+SLOT = struct.Struct("<6sI")
+
+RECORD_FIELDS = [
+    "icao",
+    "iata",
+    "name",
+    "city",
+    "municipality",
+    "country_id/id",
+    "elevation",
+    "latitude",
+    "longitude",
+    "tz",
+    "lid",
+]
+
+
+def _key(kind, code):
+    return f"{kind}:{code.strip().upper()}".encode("ascii", "ignore")
+
+
+def _first_slot(key, slot_count):
+    return zlib.crc32(key) & (slot_count - 1)
+
+
+def build_index(csv_path, index_path):
+    """Build the lookup file from a CSV in the format of flight.aerodrome.csv"""
+    records = bytearray()
+    entries = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if not row.get("icao"):
+                continue
+            offset = len(records)
+            values = [
+                (row.get(name) or "").replace("\t", " ").replace("\n", " ")
+                for name in RECORD_FIELDS
+            ]
+            records += ("\t".join(values) + "\n").encode("utf-8")
+            entries.append((_key("I", row["icao"]), offset))
+            if row.get("iata"):
+                entries.append((_key("A", row["iata"]), offset))
+
+    # Power of two with a load factor below 0.75 keeps probe chains short
+    slot_count = 1 << (len(entries) * 4 // 3).bit_length()
+    slots = bytearray(SLOT.size * slot_count)
+    for key, offset in entries:
+        if len(key) > SLOT.size - 4:
+            continue
+        slot = _first_slot(key, slot_count)
+        while True:
+            slot_key, slot_offset = SLOT.unpack_from(slots, slot * SLOT.size)
+            if not slot_offset:
+                SLOT.pack_into(slots, slot * SLOT.size, key, offset + 1)
+                break
+            if slot_key.rstrip(b"\0") == key:
+                # Duplicate code, the first aerodrome wins
+                break
+            slot = (slot + 1) & (slot_count - 1)
+
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, slot_count, len(entries)))
+        f.write(slots)
+        f.write(records)
+    os.replace(tmp_path, index_path)
+
+
+class AerodromeIndex:
+    """Read-only view of a lookup file, lookups are O(1) and load nothing"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._slot_count, self.record_count = HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an aerodrome index file")
+        self._records_offset = HEADER.size + self._slot_count * SLOT.size
+
+    def _find(self, key):
+        slot = _first_slot(key, self._slot_count)
+        while True:
+            slot_key, offset = SLOT.unpack_from(
+                self._data, HEADER.size + slot * SLOT.size
+            )
+            if not offset:
+                return None
+            if slot_key.rstrip(b"\0") == key:
+                return offset - 1
+            slot = (slot + 1) & (self._slot_count - 1)
+
+    def _read_record(self, offset):
+        start = self._records_offset + offset
+        end = self._data.find(b"\n", start)
+        values = self._data[start:end].decode("utf-8").split("\t")
+        return dict(zip(RECORD_FIELDS, values, strict=True))
+
+    def records(self):
+        """Iterate over all aerodrome rows, in file order"""
+        start = self._records_offset
+        size = len(self._data)
+        while start < size:
+            end = self._data.find(b"\n", start)
+            values = self._data[start:end].decode("utf-8").split("\t")
+            yield dict(zip(RECORD_FIELDS, values, strict=True))
+            start = end + 1
+
+    def lookup(self, code):
+        """Return the aerodrome row for an ICAO or IATA code, or None"""
+        if not code or not code.strip():
+            return None
+        for kind in ("I", "A"):
+            offset = self._find(_key(kind, code))
+            if offset is not None:
+                return self._read_record(offset)
+        return None
+
+
+@functools.cache
+def open_index(path):
+    """Open a lookup file once per process, the mapping is shared by the OS"""
+    return AerodromeIndex(path)
@@ -0,0 +1,105 @@
+# Copyright 2024 Apexive <https://apexive.com/>
+# License MIT (https://opensource.org/licenses/MIT).
+"""
+Great-circle helpers and a k-d tree for nearest aerodrome lookups.
+
+Points are indexed as unit vectors: the straight line (chord) distance between
+two unit vectors grows with the great-circle distance, so a plain 3D k-d tree
+answers nearest neighbour queries on the sphere without special cases for the
+poles or the antimeridian.
+"""
+
+import heapq
+import math
+
+EARTH_RADIUS_NM = 3440.065
+
+
+def to_unit_vector(latitude, longitude):
+    lat, lon = math.radians(latitude), math.radians(longitude)
+    return (
+        math.cos(lat) * math.cos(lon),
+        math.cos(lat) * math.sin(lon),
+        math.sin(lat),
+    )
+
+
+def chord_to_nm(chord):
+    return 2 * EARTH_RADIUS_NM * math.asin(min(chord / 2, 1.0))
+
+
+def nm_to_chord(distance_nm):
+    return 2 * math.sin(min(distance_nm / EARTH_RADIUS_NM, math.pi) / 2)
+
+
+def distance_nm(lat1, lon1, lat2, lon2):
+    """Great-circle (haversine) distance in nautical miles"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_NM * math.asin(min(math.sqrt(a), 1.0))
+
+
+class KDTree:
+    """Static k-d tree over ``(latitude, longitude, payload)`` points"""
+
+    def __init__(self, points):
+        nodes = [(to_unit_vector(lat, lon), payload) for lat, lon, payload in points]
+        self._root = self._build(nodes, 0)
+        self.size = len(nodes)
+
+    def _build(self, nodes, depth):
+        if not nodes:
+            return None
+        axis = depth % 3
+        nodes.sort(key=lambda node: node[0][axis])
+        median = len(nodes) // 2
+        return (
+            nodes[median][0],
+            nodes[median][1],
+            axis,
+            self._build(nodes[:median], depth + 1),
+            self._build(nodes[median + 1 :], depth + 1),
+        )
+
+    def nearest(self, latitude, longitude, k=1, radius_nm=None):
+        """
+        Return up to ``k`` ``(payload, distance_nm)`` pairs ordered by
+        distance, optionally limited to ``radius_nm``.
+        """
+        target = to_unit_vector(latitude, longitude)
+        bound = nm_to_chord(radius_nm) ** 2 if radius_nm is not None else math.inf
+        heap = []  # max-heap of (-squared chord, counter, payload)
+        counter = 0
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            point, payload, axis, left, right = node
+            dist2 = sum((a - b) ** 2 for a, b in zip(point, target, strict=True))
+            worst = -heap[0][0] if len(heap) == k else bound
+            if dist2 <= worst:
+                counter += 1
+                entry = (-dist2, counter, payload)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heapreplace(heap, entry)
+                worst = -heap[0][0] if len(heap) == k else bound
+
+            diff = target[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # Push the far side first so the near side is explored first
+            if diff * diff <= worst:
+                stack.append(far)
+            stack.append(near)
+
+        return [
+            (payload, chord_to_nm(math.sqrt(-neg_dist2)))
+            for neg_dist2, _counter, payload in sorted(heap, reverse=True)
+        ]
@@ -0,0 +1,42 @@
+# Copyright 2024 Apexive <https://apexive.com/>
+# License MIT (https://opensource.org/licenses/MIT).
+"""
+Cached UTC to local time conversion for aerodrome timezones.
+
+Converters are built once per timezone name and process, so rendering many
+times only costs a dictionary lookup and an ``astimezone`` per value.
+"""
+
+from functools import cache
+
+import pytz
+
+
+@cache
+def get_converter(tz_name):
+    """
+    Return a function converting a naive UTC datetime to a naive local
+    datetime in ``tz_name``, or None for an unknown or empty timezone.
+    """
+    if not tz_name:
+        return None
+    try:
+        tz = pytz.timezone(tz_name)
+    except pytz.UnknownTimeZoneError:
+        return None
+
+    def convert(value):
+        return pytz.utc.localize(value).astimezone(tz).replace(tzinfo=None)
+
+    return convert
+
+
+def format_relative_time(value, base_date):
+    """Format ``value`` as HH:MM with the day offset to ``base_date``, e.g. 01:15 (+1)"""
+    time_str = value.strftime("%H:%M")
+    days = (value.date() - base_date).days
+    if days > 0:
+        time_str += f" (+{days})"
+    elif days < 0:
+        time_str += f" ({days})"
+    return time_str
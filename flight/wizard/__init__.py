@@ -0,0 +1,2 @@
+from . import flight_aerodrome_import_wizard
+from . import flight_lock_wizard
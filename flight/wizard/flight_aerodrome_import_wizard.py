@@ -0,0 +1,51 @@
+# Copyright 2024 Apexive <https://apexive.com/>
+# License MIT (https://opensource.org/licenses/MIT).
+import base64
+import io
+
+from odoo import fields, models
+
+
+class FlightAerodromeImportWizard(models.TransientModel):
+    _name = "flight.aerodrome.import.wizard"
+    _description = "Aerodrome Bulk Import Wizard"
+
+    file = fields.Binary(
+        help="CSV file in the format of flight.aerodrome.csv, or a delta file "
+        "generated by data/generate_aerodrome_csv.py. "
+        "Leave empty to load the dataset bundled with the module."
+    )
+    filename = fields.Char()
+    state = fields.Selection(
+        [("draft", "Draft"), ("done", "Done")], default="draft", required=True
+    )
+    inserted_count = fields.Integer(string="Inserted", readonly=True)
+    updated_count = fields.Integer(string="Updated", readonly=True)
+    unchanged_count = fields.Integer(string="Unchanged", readonly=True)
+    removed_count = fields.Integer(string="Removed", readonly=True)
+
+    def action_import(self):
+        self.ensure_one()
+        csv_file = None
+        if self.file:
+            csv_file = io.StringIO(
+                base64.b64decode(self.file).decode("utf-8-sig"), newline=""
+            )
+        counts = self.env["flight.aerodrome"]._load_aerodrome_csv(csv_file)
+        self.write(
+            {
+                "state": "done",
+                "inserted_count": counts["inserted"],
+                "updated_count": counts["updated"],
+                "unchanged_count": counts["unchanged"],
+                "removed_count": counts["removed"],
+            }
+        )
+        return {
+            "type": "ir.actions.act_window",
+            "res_model": self._name,
+            "res_id": self.id,
+            "view_mode": "form",
+            "views": [(False, "form")],
+            "target": "new",
+        }
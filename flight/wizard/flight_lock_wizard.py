@@ -0,0 +1,36 @@
+# Copyright 2024 Apexive <https://apexive.com/>
+# License MIT (https://opensource.org/licenses/MIT).
+from odoo import _, fields, models
+
+
+class FlightLockWizard(models.TransientModel):
+    _name = "flight.lock.wizard"
+    _description = "Flight Period Lock Wizard"
+
+    date_from = fields.Date(required=True)
+    date_to = fields.Date(required=True, default=fields.Date.context_today)
+    aircraft_ids = fields.Many2many(
+        "flight.aircraft",
+        string="Aircraft",
+        help="Leave empty to apply to all aircraft",
+    )
+    operation = fields.Selection(
+        [("lock", "Lock"), ("unlock", "Unlock")], default="lock", required=True
+    )
+
+    def action_apply(self):
+        self.ensure_one()
+        locked = self.operation == "lock"
+        count = self.env["flight.flight"].lock_period(
+            self.date_from, self.date_to, self.aircraft_ids.ids, locked=locked
+        )
+        message = _("%s flights locked") if locked else _("%s flights unlocked")
+        return {
+            "type": "ir.actions.client",
+            "tag": "display_notification",
+            "params": {
+                "message": message % count,
+                "type": "success",
+                "next": {"type": "ir.actions.act_window_close"},
+            },
+        }
@@ -1,6 +1,6 @@
 {
     "name": "Flight Data Sync",
-    "version": "16.0.0.1",
+    "version": "16.0.0.2",
     "author": "Apexive Solutions LLC",
     "website": "https://github.com/OCA/server-env",
     "license": "LGPL-3",
@@ -16,6 +16,7 @@
         "views/actions.xml",
         "views/flight_data_provider_views.xml",
         "views/flight_data_registry_views.xml",
+        "views/flight_data_sync_run_views.xml",
         "views/menu.xml",
         "wizard/flight_data_sync_wizard_views.xml",
     ],
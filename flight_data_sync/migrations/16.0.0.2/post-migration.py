@@ -0,0 +1,21 @@
+from odoo import SUPERUSER_ID, api
+from odoo.tools.sql import column_exists
+
+
+def migrate(cr, version):
+    if not column_exists(cr, "flight_data_sync_log", "body"):
+        return
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    Log = env["flight.data.sync.log"]
+    cr.execute("SELECT id FROM flight_data_sync_log WHERE body IS NOT NULL ORDER BY id")
+    ids = [row[0] for row in cr.fetchall()]
+    for index in range(0, len(ids), 1000):
+        batch = ids[index : index + 1000]
+        cr.execute(
+            "SELECT id, body FROM flight_data_sync_log WHERE id = ANY(%s)", [batch]
+        )
+        for log_id, body in cr.fetchall():
+            Log.browse(log_id).body = body
+        Log.flush_model()
+        Log.invalidate_model()
+    cr.execute("ALTER TABLE flight_data_sync_log DROP COLUMN body")
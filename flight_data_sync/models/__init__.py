@@ -1,2 +1,3 @@
 from . import flight_data_provider
 from . import flight_data_registry
+from . import flight_data_sync_run
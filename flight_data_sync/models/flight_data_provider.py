@@ -1,8 +1,18 @@
 # Copyright 2023 Apexive Solutions LLC
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
+import base64
+import hashlib
 import logging
+import queue
+import threading
+import time
 import traceback
+import zlib
+from collections import defaultdict, namedtuple
+from collections.abc import Iterator, Sized
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from functools import partial
 
 from dateutil.relativedelta import relativedelta
@@ -13,6 +23,154 @@ from odoo.tools.safe_eval import safe_eval
 
 _logger = logging.getLogger(__name__)
 
+# Received data with sync metadata. Providers streaming their data can yield
+# SyncPage objects instead of bare pages to attach a resume token: the
+# checkpoint of the last committed page is passed back to _receive_*_data as
+# ``checkpoint``. A watermark (cursor or last-modified timestamp) returned with
+# the data, streamed or not, becomes the ``watermark`` passed to the next run
+# once this one has been processed successfully.
+SyncPage = namedtuple(
+    "SyncPage", ["data", "checkpoint", "watermark"], defaults=(None, None)
+)
+
+
+class _PageChannel:
+    """Bounded hand-over of received pages from a worker thread"""
+
+    def __init__(self, maxsize):
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.cancelled = threading.Event()
+
+    def put(self, kind, value=None):
+        while not self.cancelled.is_set():
+            try:
+                self.queue.put((kind, value), timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(self):
+        kind, value = self.queue.get()
+        if kind == "error":
+            raise value
+        return kind, value
+
+    def pages(self):
+        try:
+            while True:
+                kind, page = self.get()
+                if kind == "end":
+                    return
+                yield page
+        finally:
+            self.cancelled.set()
+
+
+class _ClientPool:
+    """
+    Provider clients kept alive between operations, per server process.
+
+    A client is checked out by one operation at a time and checked back in
+    afterwards, so its open connections and auth token are reused across the
+    operations and schedules of a run until it expires.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.idle = defaultdict(list)
+
+    def checkout(self, key):
+        """Return an idle ``(expires, client)`` for ``key`` or None, and the
+        expired ``(key, client)`` of all the keys of the database to close"""
+        now = time.monotonic()
+        expired = []
+        with self.lock:
+            # Swept for every key, some may never be checked out again
+            for idle_key in list(self.idle):
+                if idle_key[0] != key[0]:
+                    continue
+                entries = self.idle.pop(idle_key)
+                expired += [
+                    (idle_key, client) for expires, client in entries if expires <= now
+                ]
+                entries = [entry for entry in entries if entry[0] > now]
+                if entries:
+                    self.idle[idle_key] = entries
+            entries = self.idle.pop(key, [])
+            entry = entries.pop() if entries else None
+            if entries:
+                self.idle[key] = entries
+        return entry, expired
+
+    def checkin(self, key, client, expires):
+        with self.lock:
+            self.idle[key].append((expires, client))
+
+    def drain(self, match):
+        """Remove and return the idle clients of the keys matching ``match``"""
+        with self.lock:
+            keys = [key for key in self.idle if match(key)]
+            return [client for key in keys for __, client in self.idle.pop(key)]
+
+
+_client_pool = _ClientPool()
+
+
+class _SyncTelemetry:
+    """Stage timings and record counters of one sync run, see flight.data.sync.run"""
+
+    def __init__(self):
+        self.start = fields.Datetime.now()
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+        # stage -> [wall time, query count, query time]
+        self.stages = defaultdict(lambda: [0.0, 0, 0.0])
+        self.counters = defaultdict(int)
+
+    @contextmanager
+    def measure(self, stage):
+        thread = threading.current_thread()
+        if not hasattr(thread, "query_count"):
+            # The cursor only counts the queries of threads having these
+            thread.query_count = 0
+            thread.query_time = 0.0
+        start = time.monotonic()
+        query_count, query_time = thread.query_count, thread.query_time
+        try:
+            yield
+        finally:
+            with self.lock:
+                totals = self.stages[stage]
+                totals[0] += time.monotonic() - start
+                totals[1] += thread.query_count - query_count
+                totals[2] += thread.query_time - query_time
+
+    def add(self, **counters):
+        with self.lock:
+            for name, value in counters.items():
+                self.counters[name] += value
+
+    def add_received(self, data):
+        if isinstance(data, SyncPage):
+            data = data.data
+        if isinstance(data, str):
+            self.add(payload_bytes=len(data.encode()))
+        elif isinstance(data, bytes | bytearray):
+            self.add(payload_bytes=len(data))
+        elif isinstance(data, Sized):
+            self.add(records_received=len(data))
+
+    def measure_pages(self, pages):
+        pages = iter(pages)
+        while True:
+            with self.measure("receive"):
+                page = next(pages, StopIteration)
+            if page is StopIteration:
+                return
+            self.add_received(page)
+            yield page
+
 
 class FlightDataProvider(models.Model):
     _name = "flight.data.provider"
@@ -46,6 +204,31 @@ class FlightDataProvider(models.Model):
         string="Run As User",
         help="If set, schedules will run as this user. Otherwise, they will run as the current user.",
     )
+    max_concurrency = fields.Integer(
+        string="Max Parallel Requests",
+        default=1,
+        help="Maximum number of receive/send operations run at the same time "
+        "against this provider when schedules are synced in parallel.",
+    )
+    client_lifetime = fields.Integer(
+        string="Client Reuse (s)",
+        default=0,
+        help="Number of seconds a client built by get_client, with its open "
+        "connections and auth token, is reused across operations and "
+        "schedules. 0 builds a new client for every operation. Only enable "
+        "it for services whose client does not keep a reference to the "
+        "environment or to records.",
+    )
+
+    def write(self, vals):
+        res = super().write(vals)
+        # Credentials or endpoint may have changed
+        self._close_pooled_clients()
+        return res
+
+    def unlink(self):
+        self._close_pooled_clients()
+        return super().unlink()
 
     @api.model
     def _get_available_services(self):
@@ -77,19 +260,92 @@ class FlightDataProvider(models.Model):
         return self._get_available_sync_models()
 
     def get_client(self, schedule):
+        """
+        Build the client of the service used by the sync operations.
+
+        When ``client_lifetime`` is set, the client is pooled and reused by
+        later operations, from other threads, cursors and schedules. A pooled
+        client must then only hold connection state (sessions, tokens): it
+        must not keep a reference to ``self.env``, to ``schedule`` or to any
+        other record, which would be used after their cursor is closed.
+        """
         return self._raise_not_implemented("get_client")
 
+    def _get_client_pool_key(self, schedule):
+        """
+        Hook for extension. Clients are shared by all schedules of a provider,
+        include what get_client depends on in the key to split them. The key
+        must start with the database name and the provider id.
+
+        Clients are dropped when the provider is modified in this process,
+        other processes keep theirs until they expire.
+        """
+        return (self.env.cr.dbname, self.id)
+
+    def _acquire_client(self, schedule):
+        """
+        Check out a pooled client, or build one with get_client.
+
+        Returns the client and a function giving it back to the pool, to call
+        with ``discard=True`` when the client must not be reused, e.g. after an
+        error.
+        """
+        lifetime = self.client_lifetime
+        key = self._get_client_pool_key(schedule)
+        entry, expired = _client_pool.checkout(key) if lifetime > 0 else (None, [])
+        for expired_key, client in expired:
+            provider = self.browse(expired_key[1]).exists() or self
+            provider._close_client(client)
+        if entry:
+            expires, client = entry
+        else:
+            client = self.get_client(schedule)
+            expires = time.monotonic() + lifetime
+
+        def release(discard=False):
+            if discard or time.monotonic() >= expires:
+                self._close_client(client)
+            else:
+                _client_pool.checkin(key, client, expires)
+
+        return client, release
+
+    def _close_client(self, client):
+        """Hook for extension, release the connections held by a client"""
+        close = getattr(client, "close", None)
+        if not callable(close):
+            return
+        try:
+            close()
+        except Exception:
+            _logger.warning("Error closing %s client", self.service, exc_info=True)
+
+    def _close_pooled_clients(self):
+        dbname = self.env.cr.dbname
+        ids = set(self.ids)
+        clients = _client_pool.drain(lambda key: key[0] == dbname and key[1] in ids)
+        for client in clients:
+            self._close_client(client)
+
+    def _get_sync_provider(self):
+        self.ensure_one()
+        # Use sudo() if user_id is set, otherwise use self
+        provider = self
+        if self.user_id:
+            provider = provider.sudo().with_user(self.user_id)
+        # Registry lookups are cached for the duration of the run
+        return provider.with_context(flight_data_registry_cache={})
+
     def _sync(self, schedule):
         _logger.info(f"Starting _sync for provider: {self.name}")
         self.ensure_one()
 
+        telemetry = _SyncTelemetry()
         try:
             kwargs = safe_eval(schedule.kwargs or "{}")
-
-            # Use sudo() if user_id is set, otherwise use self
-            provider = self
-            if self.user_id:
-                provider = provider.sudo().with_user(self.user_id)
+            provider = self.with_context(
+                flight_data_sync_telemetry=telemetry
+            )._get_sync_provider()
 
             # Receive data
             received_data = provider.receive_data(schedule, **kwargs)
@@ -99,21 +355,241 @@ class FlightDataProvider(models.Model):
             data_to_send = provider.prepare_data(schedule, **kwargs)
             provider.send_data(schedule, data_to_send, **kwargs)
 
-            schedule.write(
+            self._sync_succeeded(schedule, telemetry)
+        except Exception as e:
+            self._sync_failed(schedule, e, telemetry)
+
+    def _sync_succeeded(self, schedule, telemetry=None):
+        values = {
+            "last_run": fields.Datetime.now(),
+            "last_success": fields.Datetime.now(),
+            "checkpoint": False,
+            "checkpoint_page": 0,
+        }
+        if schedule.pending_watermark:
+            values.update(watermark=schedule.pending_watermark, pending_watermark=False)
+        schedule.write(values)
+        if telemetry:
+            self._save_sync_run(schedule, telemetry, "done")
+        self._get_sync_provider().message_post(
+            body=_("Data sync successful for schedule: %s") % schedule.name
+        )
+
+    def _sync_failed(self, schedule, error, telemetry=None):
+        _logger.error("Error in _sync method: %s", error, exc_info=error)
+        values = {"last_run": fields.Datetime.now()}
+        if not schedule.checkpoint_page:
+            # Nothing to resume, the data behind this watermark was not processed
+            values["pending_watermark"] = False
+        schedule.write(values)
+        if telemetry:
+            self._save_sync_run(schedule, telemetry, "failed", error)
+        self.message_post(body=_("Error in schedule %s: %s") % (schedule.name, error))
+
+    def _save_sync_run(self, schedule, telemetry, state, error=None):
+        values = {
+            "provider_id": schedule.provider_id.id,
+            "schedule_id": schedule.id,
+            "start": telemetry.start,
+            "duration": time.monotonic() - telemetry.started,
+            "state": state,
+            "error": error and str(error),
+        }
+        for stage in ("receive", "process", "prepare", "send"):
+            wall_time, query_count, query_time = telemetry.stages[stage]
+            values.update(
                 {
-                    "last_run": fields.Datetime.now(),
-                    "last_success": fields.Datetime.now(),
+                    f"{stage}_time": wall_time,
+                    f"{stage}_query_count": query_count,
+                    f"{stage}_query_time": query_time,
                 }
             )
-            provider.message_post(
-                body=_("Data sync successful for schedule: %s") % schedule.name
-            )
+        for name in (
+            "records_received",
+            "records_created",
+            "records_updated",
+            "records_skipped",
+            "payload_bytes",
+        ):
+            values[name] = telemetry.counters[name]
+        return self.env["flight.data.sync.run"].sudo().create(values)
+
+    def _add_sync_stats(self, **counters):
+        """
+        Add to the counters of the current sync run, e.g. ``payload_bytes``
+        from _receive_*_data or ``records_skipped`` from _process_*_data
+        """
+        telemetry = self.env.context.get("flight_data_sync_telemetry")
+        if telemetry:
+            telemetry.add(**counters)
+
+    @api.model
+    def _get_parallel_workers(self):
+        """Size of the thread pool used for the I/O steps, 1 disables it"""
+        if self.env.registry.in_test_mode():
+            return 1
+        return int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("flight_data_sync.parallel_workers", 1)
+        )
+
+    @api.model
+    def _sync_schedules(self, schedules):
+        workers = self._get_parallel_workers()
+        if workers > 1 and len(schedules) > 1:
+            self._sync_parallel(schedules, workers)
+        else:
+            for schedule in schedules:
+                schedule.provider_id._sync(schedule)
+
+    @api.model
+    def _sync_parallel(self, schedules, max_workers):
+        """
+        Sync several schedules with their network I/O overlapped.
+
+        The receive and send steps run in a thread pool, each with its own
+        cursor and environment, at most ``max_concurrency`` at a time per
+        provider. The process and prepare steps run in the current
+        transaction, one schedule at a time, since the ORM is not thread-safe.
+        Data returned by ``_receive_*_data`` is handed over between threads, it
+        must therefore not hold records.
+        """
+        semaphores = {
+            provider.id: threading.BoundedSemaphore(max(provider.max_concurrency, 1))
+            for provider in schedules.provider_id
+        }
+        failed = {}
+        telemetries = {schedule: _SyncTelemetry() for schedule in schedules}
+        kwargs_by_schedule = {}
+        for schedule in schedules:
+            try:
+                kwargs_by_schedule[schedule] = safe_eval(schedule.kwargs or "{}")
+            except Exception as e:
+                failed[schedule] = e
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="flight_data_sync"
+        ) as executor:
+
+            def submit(schedule, operation, *args, **kwargs):
+                return executor.submit(
+                    self.with_context(
+                        flight_data_sync_telemetry=telemetries[schedule]
+                    )._run_io_operation,
+                    semaphores[schedule.provider_id.id],
+                    schedule.id,
+                    operation,
+                    *args,
+                    **kwargs,
+                )
+
+            receiving = {}
+            for schedule, kwargs in kwargs_by_schedule.items():
+                channel = _PageChannel(maxsize=max(schedule.chunk_size, 1) * 2)
+                executor.submit(
+                    self.with_context(
+                        flight_data_sync_telemetry=telemetries[schedule]
+                    )._run_receive_operation,
+                    semaphores[schedule.provider_id.id],
+                    schedule.id,
+                    channel,
+                    **kwargs,
+                )
+                receiving[schedule] = channel
+
+            sending = {}
+            for schedule, channel in receiving.items():
+                kwargs = kwargs_by_schedule[schedule]
+                provider = schedule.provider_id.with_context(
+                    flight_data_sync_telemetry=telemetries[schedule]
+                )._get_sync_provider()
+                try:
+                    kind, received_data = channel.get()
+                    if kind == "stream":
+                        # Streamed pages are committed chunk by chunk, keep
+                        # the work done for the previous schedules
+                        self._commit_progress()
+                        provider.process_data(schedule, channel.pages())
+                        data_to_send = provider.prepare_data(schedule, **kwargs)
+                    else:
+                        with self.env.cr.savepoint():
+                            provider.process_data(schedule, received_data)
+                            data_to_send = provider.prepare_data(schedule, **kwargs)
+                except Exception as e:
+                    channel.cancelled.set()
+                    failed[schedule] = e
+                    continue
+                sending[schedule] = submit(schedule, "send", data_to_send, **kwargs)
+
+            for schedule, future in sending.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    failed[schedule] = e
+
+        for schedule in schedules:
+            if schedule in failed:
+                schedule.provider_id._sync_failed(
+                    schedule, failed[schedule], telemetries[schedule]
+                )
+            else:
+                schedule.provider_id._sync_succeeded(schedule, telemetries[schedule])
+
+    def _run_receive_operation(self, semaphore, schedule_id, channel, **kwargs):
+        """
+        Run a receive step in a worker thread with its own cursor. A returned
+        iterator of pages is consumed here, the cursor staying open, and its
+        pages are handed over one by one through the bounded ``channel``.
+        """
+        try:
+            with self.env.registry.cursor() as cr:
+                threading.current_thread().dbname = cr.dbname
+                env = api.Environment(cr, self.env.uid, self.env.context)
+                schedule = env["flight.data.sync.schedule"].browse(schedule_id)
+                provider = schedule.provider_id._get_sync_provider()
+                self._hand_over_received(
+                    semaphore,
+                    channel,
+                    partial(provider.receive_data, schedule, **kwargs),
+                )
         except Exception as e:
-            _logger.exception(f"Error in _sync method: {str(e)}")
-            schedule.write({"last_run": fields.Datetime.now()})
-            self.message_post(
-                body=_("Error in schedule %s: %s") % (schedule.name, str(e))
-            )
+            channel.put("error", e)
+
+    @api.model
+    def _hand_over_received(self, semaphore, channel, receive):
+        """
+        Put the data returned by ``receive()`` in ``channel``, page by page
+        when it is an iterator.
+
+        The provider semaphore is only held while receiving, not while waiting
+        for the main thread to take a page: it may be reading the pages of
+        another schedule of the same provider, which need the semaphore.
+        """
+        with semaphore:
+            received_data = receive()
+        if not isinstance(received_data, Iterator):
+            channel.put("result", received_data)
+            return
+        channel.put("stream")
+        while True:
+            with semaphore:
+                try:
+                    page = next(received_data)
+                except StopIteration:
+                    break
+            if not channel.put("page", page):
+                return
+        channel.put("end")
+
+    def _run_io_operation(self, semaphore, schedule_id, operation, *args, **kwargs):
+        """Run a receive or send step in a worker thread with its own cursor"""
+        with semaphore, self.env.registry.cursor() as cr:
+            threading.current_thread().dbname = cr.dbname
+            env = api.Environment(cr, self.env.uid, self.env.context)
+            schedule = env["flight.data.sync.schedule"].browse(schedule_id)
+            provider = schedule.provider_id._get_sync_provider()
+            return provider._dispatch(schedule, operation, *args, **kwargs)
 
     def _dispatch(self, schedule, operation, *args, **kwargs):
         method_name = f"_{operation}_{schedule.model.replace('flight.', '')}_data"
@@ -123,11 +599,14 @@ class FlightDataProvider(models.Model):
             raise NotImplementedError(f"Method '{method_name}' not implemented")
 
         self.ensure_one()
-        client = self.get_client(schedule)
+        telemetry = self.env.context.get("flight_data_sync_telemetry")
+        client, release = self._acquire_client(schedule)
 
         try:
-            return partial(method, client, schedule, *args, **kwargs)()
+            with telemetry.measure(operation) if telemetry else nullcontext():
+                result = partial(method, client, schedule, *args, **kwargs)()
         except Exception as e:
+            release(discard=True)
             print(traceback.format_exc())
             _logger.error(
                 f"Error trying to {operation} {schedule.model} data for {self.service}: %s",
@@ -139,13 +618,96 @@ class FlightDataProvider(models.Model):
                 )
                 % e
             ) from e
+        if isinstance(result, Iterator):
+            if telemetry and operation == "receive":
+                result = telemetry.measure_pages(result)
+            # The client is used until the last page has been read
+            return self._release_client_after(result, release)
+        release()
+        if telemetry and operation == "receive":
+            telemetry.add_received(result)
+        return result
+
+    def _release_client_after(self, pages, release):
+        discard = True
+        try:
+            yield from pages
+            discard = False
+        finally:
+            release(discard=discard)
 
     def receive_data(self, schedule, **kwargs):
+        # Only passed when set, so that services not supporting them keep working
+        if schedule.watermark:
+            kwargs.setdefault("watermark", schedule.watermark)
+        if schedule.checkpoint:
+            kwargs.setdefault("checkpoint", schedule.checkpoint)
         return self._dispatch(schedule, "receive", **kwargs)
 
     def process_data(self, schedule, data):
+        if isinstance(data, Iterator):
+            return self._process_pages(schedule, data)
+        if isinstance(data, SyncPage):
+            if data.watermark:
+                schedule.pending_watermark = data.watermark
+            data = data.data
         return self._dispatch(schedule, "process", data)
 
+    def _process_pages(self, schedule, pages):
+        """
+        Process an iterator of pages returned by ``_receive_*_data``.
+
+        Pages are handed to ``_process_*_data`` one at a time and committed
+        every ``chunk_size`` pages together with a checkpoint on the schedule.
+        An interrupted run resumes after the last committed page: from the
+        provider resume token when pages are SyncPage objects with a
+        checkpoint, otherwise by skipping the pages already processed.
+        """
+        chunk_size = max(schedule.chunk_size, 1)
+        if schedule.checkpoint:
+            page_number, skip = schedule.checkpoint_page, 0
+        else:
+            page_number, skip = 0, schedule.checkpoint_page
+        pages = iter(pages)
+        while True:
+            # A failing chunk is rolled back as a whole, the previous chunks
+            # stay committed with their checkpoint
+            with self.env.cr.savepoint():
+                processed = 0
+                checkpoint = None
+                for page in pages:
+                    page_number += 1
+                    if page_number <= skip:
+                        continue
+                    checkpoint = None
+                    if isinstance(page, SyncPage):
+                        if page.watermark:
+                            schedule.pending_watermark = page.watermark
+                        page, checkpoint = page.data, page.checkpoint
+                    self._dispatch(schedule, "process", page)
+                    processed += 1
+                    if processed >= chunk_size:
+                        break
+                if processed:
+                    schedule.write(
+                        {
+                            "last_run": fields.Datetime.now(),
+                            "checkpoint": checkpoint or False,
+                            "checkpoint_page": page_number,
+                        }
+                    )
+            if processed:
+                self._commit_progress()
+            if processed < chunk_size:
+                return
+
+    @api.model
+    def _commit_progress(self):
+        if self.env.registry.in_test_mode():
+            return False
+        self.env.cr.commit()
+        return True
+
     def prepare_data(self, schedule, **kwargs):
         return self._dispatch(schedule, "prepare", **kwargs)
 
@@ -153,13 +715,109 @@ class FlightDataProvider(models.Model):
         return self._dispatch(schedule, "send", data, **kwargs)
 
     def _update_or_create(self, model, search_domain, values):
+        """Single record upsert, prefer _bulk_upsert when processing feeds"""
         record = model.search(search_domain, limit=1)
         if not record:
+            self._add_sync_stats(records_created=1)
             return model.create(values)
         record.ensure_one()
         record.write(values)
+        self._add_sync_stats(records_updated=1)
         return record
 
+    def _bulk_upsert(self, model, key_fields, values_list):
+        """
+        Create or update many records of ``model`` matched on ``key_fields``.
+
+        Existing records are fetched with a single search, new records are
+        created with one ``create(vals_list)``, and writes are skipped when the
+        values are unchanged and grouped when they are identical, so that
+        processing a feed costs in proportion to the number of changes.
+
+        :param key_fields: field name or list of field names identifying a
+            record, e.g. ``["provider_id", "external_ref"]``
+        :param values_list: list of value dicts, each containing the key fields
+        :return: the upserted records, in the order of ``values_list``
+        """
+        if isinstance(key_fields, str):
+            key_fields = [key_fields]
+
+        # Later values for the same key complete or override earlier ones
+        values_by_key = {}
+        for values in values_list:
+            key = tuple(
+                self._upsert_key(model, name, values.get(name)) for name in key_fields
+            )
+            values_by_key.setdefault(key, {}).update(values)
+        if not values_by_key:
+            return model.browse()
+
+        domain = [
+            (name, "in", list({key[index] for key in values_by_key}))
+            for index, name in enumerate(key_fields)
+        ]
+        existing = {}
+        for record in model.search(domain):
+            key = tuple(
+                self._upsert_key(record, name, record[name]) for name in key_fields
+            )
+            existing.setdefault(key, record)
+
+        to_create = []
+        to_write = {}
+        for key, values in values_by_key.items():
+            record = existing.get(key)
+            if not record:
+                to_create.append(values)
+                continue
+            changes = self._get_changed_values(record, values)
+            if changes:
+                group_key = repr(sorted(changes.items()))
+                group = to_write.setdefault(group_key, [model.browse(), changes])
+                group[0] |= record
+
+        for records, changes in to_write.values():
+            records.write(changes)
+        created = iter(model.create(to_create) if to_create else model.browse())
+        updated = sum(len(records) for records, __ in to_write.values())
+        self._add_sync_stats(
+            records_created=len(to_create),
+            records_updated=updated,
+            records_skipped=len(values_by_key) - len(to_create) - updated,
+        )
+
+        result = model.browse()
+        for key in values_by_key:
+            result |= existing.get(key) or next(created)
+        return result
+
+    @api.model
+    def _upsert_key(self, model, name, value):
+        """
+        Return ``value`` of the field ``name`` in cache format, so that incoming
+        values (e.g. ``"2024-05-01"`` or an id) match the ones read from records
+        (``date(2024, 5, 1)`` or a recordset).
+        """
+        field = model._fields[name]
+        value = field.convert_to_cache(value, model, validate=False)
+        return False if value is None else value
+
+    @api.model
+    def _get_changed_values(self, record, values):
+        changes = {}
+        for name, value in values.items():
+            field = record._fields[name]
+            if field.type in ("one2many", "many2many"):
+                # Commands cannot be compared cheaply, always apply them
+                changes[name] = value
+                continue
+            new_value = field.convert_to_record(
+                field.convert_to_cache(value, record), record
+            )
+            if new_value != record[name]:
+                changes[name] = value
+        return changes
+
     def _raise_not_implemented(self, method_name):
         raise NotImplementedError(
             f"Method '{method_name}' not implemented for service {self.service[1]}"
@@ -215,12 +873,27 @@ class FlightDataProvider(models.Model):
 
     @api.model
     def run_scheduled_syncs(self):
-        Schedule = self.env["flight.data.sync.schedule"]
-        schedules = Schedule.search(
-            [("active", "=", True), ("next_run", "<=", fields.Datetime.now())]
-        )
-        for schedule in schedules:
-            schedule.provider_id._sync(schedule)
+        """
+        Run the due schedules, each batch in its own transaction.
+
+        Schedules are claimed with a row lock skipping locked rows, so several
+        cron workers can process different due schedules in parallel without
+        running the same one twice. When ``flight_data_sync.parallel_workers``
+        is above 1, that many schedules are claimed at once and synced with
+        their network I/O overlapped, see _sync_parallel.
+        """
+        workers = self._get_parallel_workers()
+        done_ids = []
+        while True:
+            with self.env.registry.cursor() as cr:
+                env = api.Environment(cr, self.env.uid, self.env.context)
+                schedules = env["flight.data.sync.schedule"]._claim_due_schedules(
+                    limit=workers, exclude_ids=done_ids
+                )
+                if not schedules:
+                    break
+                done_ids.extend(schedules.ids)
+                env["flight.data.provider"]._sync_schedules(schedules)
 
 
 class FlightDataSyncSchedule(models.Model):
@@ -255,7 +928,34 @@ class FlightDataSyncSchedule(models.Model):
     )
     last_run = fields.Datetime(string="Last Run")
     last_success = fields.Datetime(string="Last Successful Run")
-    next_run = fields.Datetime(string="Next Run", compute="_compute_next_run")
+    chunk_size = fields.Integer(
+        string="Pages per Commit",
+        default=1,
+        help="When the provider streams its data in pages, the changes are "
+        "committed and a checkpoint is saved every this many pages.",
+    )
+    watermark = fields.Char(
+        help="Position reached by the last successful run, e.g. a cursor or a "
+        "last-modified timestamp returned by the provider. It is passed to the "
+        "provider as ``watermark`` so that only changes are transferred. Clear "
+        "it to run a full sync.",
+    )
+    pending_watermark = fields.Char(
+        readonly=True,
+        help="Watermark returned by the current or interrupted run, applied "
+        "once it has been processed successfully",
+    )
+    checkpoint = fields.Char(
+        readonly=True,
+        help="Resume token of the last committed page of an interrupted run",
+    )
+    checkpoint_page = fields.Integer(
+        readonly=True,
+        help="Number of pages committed by an interrupted run",
+    )
+    next_run = fields.Datetime(
+        string="Next Run", compute="_compute_next_run", store=True, index=True
+    )
 
     def name_get(self):
         result = []
@@ -275,6 +975,34 @@ class FlightDataSyncSchedule(models.Model):
             "context": {"default_schedule_id": self.id},
         }
 
+    @api.model
+    def _claim_due_schedules(self, limit=1, exclude_ids=()):
+        """
+        Lock and return up to ``limit`` due schedules for the current
+        transaction, skipping the ones locked by another worker. Their
+        ``last_run`` is set, so they are no longer due once committed.
+        """
+        self.flush_model(["active", "next_run"])
+        self.env.cr.execute(
+            """
+            SELECT id
+              FROM flight_data_sync_schedule
+             WHERE active
+               AND next_run <= (now() at time zone 'UTC')
+               AND NOT (id = ANY(%s))
+          ORDER BY next_run, id
+             LIMIT %s
+               FOR UPDATE SKIP LOCKED
+            """,
+            [list(exclude_ids), limit],
+        )
+        schedules = self.browse([row[0] for row in self.env.cr.fetchall()])
+        # Move next_run ahead right away: the syncs may commit, releasing the
+        # row locks of the whole batch, and the schedules must not be claimed
+        # again by another worker meanwhile
+        schedules.write({"last_run": fields.Datetime.now()})
+        return schedules
+
     @api.depends("last_run", "interval_number", "interval_type")
     def _compute_next_run(self):
         for schedule in self:
@@ -315,8 +1043,84 @@ class FlightDataSyncLog(models.Model):
         [("inbound", "Inbound"), ("outbound", "Outbound")], required=True
     )
     headers = fields.Text(string="Headers")
-    body = fields.Text(string="Body")
+    body = fields.Text(string="Body", compute="_compute_body", inverse="_inverse_body")
+    body_data = fields.Binary(string="Compressed Body", attachment=False, readonly=True)
+    body_file = fields.Binary(
+        string="Offloaded Body",
+        attachment=True,
+        readonly=True,
+        help="Compressed body stored in the filestore when above "
+        "flight_data_sync.log_offload_threshold bytes",
+    )
+    body_size = fields.Integer(string="Body Size", readonly=True)
+    body_digest = fields.Char(string="Body SHA-256", readonly=True)
 
     schedule_name = fields.Char(
         related="schedule_id.name", string="Schedule Name", store=False, readonly=True
     )
+
+    @api.depends("body_data", "body_file")
+    def _compute_body(self):
+        for log in self:
+            # bin_size would return the size of the payload instead
+            record = log.with_context(bin_size=False)
+            payload = record.body_data or record.body_file
+            log.body = (
+                zlib.decompress(base64.b64decode(payload)).decode()
+                if payload
+                else False
+            )
+
+    def _inverse_body(self):
+        threshold = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("flight_data_sync.log_offload_threshold", 65536)
+        )
+        for log in self:
+            data = (log.body or "").encode()
+            if not data:
+                log.update(
+                    {
+                        "body_data": False,
+                        "body_file": False,
+                        "body_size": 0,
+                        "body_digest": False,
+                    }
+                )
+                continue
+            payload = base64.b64encode(zlib.compress(data))
+            offload = len(payload) > threshold
+            log.update(
+                {
+                    "body_data": False if offload else payload,
+                    "body_file": payload if offload else False,
+                    "body_size": len(data),
+                    "body_digest": hashlib.sha256(data).hexdigest(),
+                }
+            )
+
+    @api.autovacuum
+    def _gc_sync_logs(self):
+        """
+        Delete the logs older than flight_data_sync.log_retention_days, 0 keeps
+        them forever. Logs are deleted in batches, each in its own transaction,
+        to keep locks short while syncs are running.
+        """
+        params = self.env["ir.config_parameter"].sudo()
+        days = int(params.get_param("flight_data_sync.log_retention_days", 90))
+        if days <= 0:
+            return
+        batch_size = int(params.get_param("flight_data_sync.log_gc_batch_size", 1000))
+        limit_date = fields.Datetime.subtract(fields.Datetime.now(), days=days)
+        while True:
+            logs = self.sudo().search(
+                [("timestamp", "<", limit_date)], limit=batch_size, order="id"
+            )
+            if not logs:
+                break
+            logs.unlink()
+            _logger.info("Deleted %d flight data sync logs", len(logs))
+            if len(logs) < batch_size:
+                break
+            self.env["flight.data.provider"]._commit_progress()
@@ -29,46 +29,105 @@ class FlightDataRegistry(models.Model):
     def _selection_model(self):
         return self.env["flight.data.provider"]._get_available_sync_models()
 
+    @api.model
+    def _get_lookup_cache(self, provider_id, model):
+        """
+        Per-run ``{external_id: local_id}`` cache, available when the caller
+        put a dict in the ``flight_data_registry_cache`` context key, as
+        FlightDataProvider._sync does.
+        """
+        cache = self.env.context.get("flight_data_registry_cache")
+        if cache is None:
+            return None
+        return cache.setdefault((provider_id, model), {})
+
     @api.model
     def get_or_create_local_id(
         self, provider_id, model, external_id, external_provider_id, values
     ):
-        registry_entry = self.search(
-            [
-                ("provider_id", "=", provider_id),
-                ("model", "=", model),
-                ("external_id", "=", external_id),
-            ],
-            limit=1,
-        )
+        return self.get_or_create_local_ids(
+            provider_id, model, external_provider_id, [(external_id, values)]
+        )[external_id]
 
-        if registry_entry:
-            return registry_entry.local_id
+    @api.model
+    def get_or_create_local_ids(
+        self, provider_id, model, external_provider_id, records
+    ):
+        """
+        Batched get_or_create_local_id for one provider and model.
+
+        Known external ids are resolved with one query, missing target records
+        are created with a single multi-create and their registry entries are
+        inserted in one batch.
 
-        Model = self.env[model]
-        record = Model.create(values)
+        :param records: list of ``(external_id, values)`` pairs, ``values``
+            being used to create the target record when it is not registered
+        :return: ``{external_id: local_id}``
+        """
+        external_ids = list(dict.fromkeys(external_id for external_id, _ in records))
+        local_ids = self.get_local_ids(provider_id, model, external_ids)
 
+        to_create = {}
+        for external_id, values in records:
+            if not local_ids.get(external_id) and external_id not in to_create:
+                to_create[external_id] = values
+        if not to_create:
+            return local_ids
+
+        created = self.env[model].create(list(to_create.values()))
         self.create(
-            {
-                "provider_id": provider_id,
-                "model": model,
-                "local_id": record.id,
-                "external_id": external_id,
-                "external_provider_id": external_provider_id,
-            }
+            [
+                {
+                    "provider_id": provider_id,
+                    "model": model,
+                    "local_id": record.id,
+                    "external_id": external_id,
+                    "external_provider_id": external_provider_id,
+                }
+                for external_id, record in zip(to_create, created, strict=True)
+            ]
         )
-
-        return record.id
+        new_ids = dict(zip(to_create, created.ids, strict=True))
+        cache = self._get_lookup_cache(provider_id, model)
+        if cache is not None:
+            cache.update(new_ids)
+        local_ids.update(new_ids)
+        return local_ids
 
     @api.model
     def get_local_id(self, provider_id, model, external_id):
-        registry_entry = self.search(
-            [
-                ("provider_id", "=", provider_id),
-                ("model", "=", model),
-                ("external_id", "=", external_id),
-            ],
-            limit=1,
-        )
+        return self.get_local_ids(provider_id, model, [external_id])[external_id]
 
-        return registry_entry.local_id if registry_entry else False
+    @api.model
+    def get_local_ids(self, provider_id, model, external_ids):
+        """
+        Resolve several external ids with a single query.
+
+        :return: ``{external_id: local_id}``, unknown ids map to False
+        """
+        cache = self._get_lookup_cache(provider_id, model)
+        if cache is None:
+            cache = {}
+        result = {}
+        missing = []
+        for external_id in external_ids:
+            if external_id in cache:
+                result[external_id] = cache[external_id]
+            else:
+                missing.append(external_id)
+
+        if missing:
+            found = {
+                entry["external_id"]: entry["local_id"]
+                for entry in self.search_read(
+                    [
+                        ("provider_id", "=", provider_id),
+                        ("model", "=", model),
+                        ("external_id", "in", missing),
+                    ],
+                    ["external_id", "local_id"],
+                )
+            }
+            for external_id in missing:
+                result[external_id] = cache[external_id] = found.get(external_id, False)
+        return result
@@ -0,0 +1,51 @@
+# Copyright 2023 Apexive Solutions LLC
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from odoo import fields, models
+
+
+class FlightDataSyncRun(models.Model):
+    _name = "flight.data.sync.run"
+    _description = "Flight Data Sync Run"
+    _order = "start desc, id desc"
+
+    provider_id = fields.Many2one(
+        "flight.data.provider",
+        string="Provider",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    schedule_id = fields.Many2one(
+        "flight.data.sync.schedule",
+        string="Sync Schedule",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    model = fields.Selection(related="schedule_id.model", store=True)
+    start = fields.Datetime(required=True, index=True)
+    duration = fields.Float(string="Duration (s)", group_operator="avg")
+    state = fields.Selection(
+        [("done", "Succeeded"), ("failed", "Failed")], required=True
+    )
+    error = fields.Text()
+
+    receive_time = fields.Float(string="Receive Time (s)")
+    receive_query_count = fields.Integer(string="Receive Queries")
+    receive_query_time = fields.Float(string="Receive Query Time (s)")
+    process_time = fields.Float(string="Process Time (s)")
+    process_query_count = fields.Integer(string="Process Queries")
+    process_query_time = fields.Float(string="Process Query Time (s)")
+    prepare_time = fields.Float(string="Prepare Time (s)")
+    prepare_query_count = fields.Integer(string="Prepare Queries")
+    prepare_query_time = fields.Float(string="Prepare Query Time (s)")
+    send_time = fields.Float(string="Send Time (s)")
+    send_query_count = fields.Integer(string="Send Queries")
+    send_query_time = fields.Float(string="Send Query Time (s)")
+
+    records_received = fields.Integer(string="Received")
+    records_created = fields.Integer(string="Created")
+    records_updated = fields.Integer(string="Updated")
+    records_skipped = fields.Integer(string="Unchanged")
+    payload_bytes = fields.Integer(string="Payload (bytes)")
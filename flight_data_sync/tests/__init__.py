@@ -0,0 +1,3 @@
+from . import test_bulk_upsert
+from . import test_sync_checkpoint
+from . import test_sync_parallel
@@ -0,0 +1,33 @@
+from unittest.mock import patch
+
+from odoo.tests.common import TransactionCase
+
+
+class FlightDataSyncCase(TransactionCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tracking_disable=True))
+        cls.provider = cls.env["flight.data.provider"].create(
+            {"name": "Test Provider", "service": "dummy"}
+        )
+
+    def create_schedule(self, **values):
+        return self.env["flight.data.sync.schedule"].create(
+            dict(
+                {
+                    "name": "Aircraft",
+                    "provider_id": self.provider.id,
+                    "model": "flight.aircraft",
+                },
+                **values,
+            )
+        )
+
+    def patch_provider(self, **methods):
+        """Implement provider methods, e.g. the dummy service's _*_data"""
+        methods.setdefault("get_client", lambda provider, schedule: None)
+        for name, method in methods.items():
+            patcher = patch.object(type(self.provider), name, method, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
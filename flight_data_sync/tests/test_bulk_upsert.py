@@ -0,0 +1,100 @@
+from datetime import date
+from unittest.mock import patch
+
+from odoo.tests.common import TransactionCase
+
+from ..models.flight_data_provider import _SyncTelemetry
+
+
+class TestBulkUpsert(TransactionCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tracking_disable=True))
+        cls.provider = cls.env["flight.data.provider"]
+        cls.aircraft = cls.env["flight.aircraft"].create({"registration": "OK-TST"})
+        cls.departure = cls.env["flight.aerodrome"].create({"icao": "ZZZA"})
+        cls.arrival = cls.env["flight.aerodrome"].create({"icao": "ZZZB"})
+
+    def _flight_values(self, **values):
+        return dict(
+            {
+                "date": "2024-05-01",
+                "aircraft_id": self.aircraft.id,
+                "departure_id": self.departure.id,
+                "arrival_id": self.arrival.id,
+            },
+            **values,
+        )
+
+    def test_upsert_matches_date_and_many2one_keys(self):
+        Flight = self.env["flight.flight"]
+        key_fields = ["aircraft_id", "date"]
+        created = self.provider._bulk_upsert(
+            Flight, key_fields, [self._flight_values()]
+        )
+        self.assertEqual(len(created), 1)
+
+        updated = self.provider._bulk_upsert(
+            Flight, key_fields, [self._flight_values(arrival_id=self.departure.id)]
+        )
+        self.assertEqual(updated, created)
+        self.assertEqual(updated.arrival_id, self.departure)
+        self.assertEqual(
+            Flight.search_count([("aircraft_id", "=", self.aircraft.id)]), 1
+        )
+
+    def test_upsert_merges_values_for_the_same_key(self):
+        Flight = self.env["flight.flight"]
+        flights = self.provider._bulk_upsert(
+            Flight,
+            ["aircraft_id", "date"],
+            [
+                self._flight_values(),
+                self._flight_values(
+                    date=date(2024, 5, 1), arrival_id=self.departure.id
+                ),
+            ],
+        )
+        self.assertEqual(len(flights), 1)
+        self.assertEqual(flights.arrival_id, self.departure)
+
+    def test_upsert_skips_unchanged_and_groups_identical_writes(self):
+        Flight = self.env["flight.flight"]
+        key_fields = ["aircraft_id", "date"]
+        days = ["2024-05-01", "2024-05-02", "2024-05-03"]
+        flights = self.provider._bulk_upsert(
+            Flight, key_fields, [self._flight_values(date=day) for day in days]
+        )
+
+        writes = []
+        write = type(Flight).write
+
+        def record_write(records, vals):
+            writes.append((records, vals))
+            return write(records, vals)
+
+        telemetry = _SyncTelemetry()
+        provider = self.provider.with_context(flight_data_sync_telemetry=telemetry)
+        with patch.object(type(Flight), "write", record_write):
+            result = provider._bulk_upsert(
+                Flight,
+                key_fields,
+                [
+                    self._flight_values(date=days[0], arrival_id=self.departure.id),
+                    self._flight_values(date=days[1], arrival_id=self.departure.id),
+                    self._flight_values(date=days[2]),
+                ],
+            )
+
+        self.assertEqual(result, flights)
+        # The same change is written once for both flights, the unchanged
+        # flight is not written at all
+        self.assertEqual(writes, [(flights[:2], {"arrival_id": self.departure.id})])
+        self.assertEqual(
+            [flight.arrival_id for flight in flights],
+            [self.departure, self.departure, self.arrival],
+        )
+        self.assertEqual(telemetry.counters["records_created"], 0)
+        self.assertEqual(telemetry.counters["records_updated"], 2)
+        self.assertEqual(telemetry.counters["records_skipped"], 1)
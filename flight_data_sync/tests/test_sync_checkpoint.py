@@ -0,0 +1,63 @@
+from ..models.flight_data_provider import SyncPage
+from .common import FlightDataSyncCase
+
+
+class TestSyncCheckpoint(FlightDataSyncCase):
+    def setUp(self):
+        super().setUp()
+        self.schedule = self.create_schedule(chunk_size=2)
+        self.pages = ["OK-AAA", "OK-BBB", "OK-CCC", "OK-DDD"]
+        self.received = self.pages
+        self.fail_on = None
+        self.receive_kwargs = []
+
+        def receive(provider, client, schedule, **kwargs):
+            self.receive_kwargs.append(kwargs)
+            yield from self.received
+
+        def process(provider, client, schedule, registration):
+            provider.env["flight.aircraft"].create({"registration": registration})
+            if registration == self.fail_on:
+                raise ValueError(f"Cannot process {registration}")
+
+        self.patch_provider(
+            _receive_aircraft_data=receive,
+            _process_aircraft_data=process,
+            _prepare_aircraft_data=lambda provider, client, schedule, **kw: None,
+            _send_aircraft_data=lambda provider, client, schedule, data, **kw: None,
+        )
+
+    def _registrations(self):
+        return set(
+            self.env["flight.aircraft"]
+            .search([("registration", "in", self.pages)])
+            .mapped("registration")
+        )
+
+    def test_failed_chunk_is_rolled_back_and_resumed(self):
+        self.fail_on = "OK-CCC"
+        self.provider._sync(self.schedule)
+        # The first chunk is kept with its checkpoint, the failing one undone
+        self.assertEqual(self._registrations(), {"OK-AAA", "OK-BBB"})
+        self.assertEqual(self.schedule.checkpoint_page, 2)
+        self.assertFalse(self.schedule.last_success)
+
+        self.fail_on = None
+        self.provider._sync(self.schedule)
+        # The committed pages are skipped, not processed twice
+        self.assertEqual(self._registrations(), set(self.pages))
+        self.assertEqual(self.schedule.checkpoint_page, 0)
+        self.assertTrue(self.schedule.last_success)
+
+    def test_resume_from_provider_checkpoint(self):
+        self.schedule.write({"checkpoint": "token-2", "checkpoint_page": 2})
+        # The provider resumes after its token, only the remaining pages come
+        self.received = [
+            SyncPage(registration, checkpoint=f"token-{number}")
+            for number, registration in enumerate(self.pages[2:], start=3)
+        ]
+        self.provider._sync(self.schedule)
+        self.assertEqual(self.receive_kwargs[-1]["checkpoint"], "token-2")
+        self.assertEqual(self._registrations(), {"OK-CCC", "OK-DDD"})
+        self.assertTrue(self.schedule.last_success)
+        self.assertFalse(self.schedule.checkpoint)
@@ -0,0 +1,161 @@
+import threading
+
+from odoo.tests.common import TransactionCase
+
+from ..models.flight_data_provider import _PageChannel
+from .common import FlightDataSyncCase
+
+
+class TestPageChannel(TransactionCase):
+    def test_pages_until_end(self):
+        channel = _PageChannel(maxsize=4)
+        channel.put("stream")
+        for page in ("p1", "p2"):
+            channel.put("page", page)
+        channel.put("end")
+        self.assertEqual(channel.get(), ("stream", None))
+        self.assertEqual(list(channel.pages()), ["p1", "p2"])
+
+    def test_error_is_raised_to_the_consumer(self):
+        channel = _PageChannel(maxsize=4)
+        channel.put("page", "p1")
+        channel.put("error", ValueError("connection lost"))
+        pages = channel.pages()
+        self.assertEqual(next(pages), "p1")
+        with self.assertRaisesRegex(ValueError, "connection lost"):
+            next(pages)
+        self.assertTrue(channel.cancelled.is_set())
+
+    def test_producer_stops_when_consumer_stops(self):
+        channel = _PageChannel(maxsize=1)
+        pages = channel.pages()
+        self.assertTrue(channel.put("page", "p1"))
+        self.assertEqual(next(pages), "p1")
+        pages.close()
+        # Nobody reads the pages anymore, the producer must not block
+        self.assertFalse(channel.put("page", "p2"))
+
+
+class TestSyncParallel(FlightDataSyncCase):
+    def setUp(self):
+        super().setUp()
+        self.streamed = self.create_schedule(name="Streamed")
+        self.returned = self.create_schedule(name="Returned")
+        self.failing = self.create_schedule(name="Failing")
+        self.processed = []
+        self.sent = []
+
+        received = {
+            self.streamed.id: [
+                ("stream", None),
+                ("page", "s1"),
+                ("page", "s2"),
+                ("end", None),
+            ],
+            self.returned.id: [("result", "r1")],
+            self.failing.id: [("error", ValueError("service unavailable"))],
+        }
+
+        def run_receive_operation(provider, semaphore, schedule_id, channel, **kw):
+            # No cursor in the worker thread, the test one is not thread-safe
+            with semaphore:
+                for kind, value in received[schedule_id]:
+                    channel.put(kind, value)
+
+        def run_io_operation(provider, semaphore, schedule_id, operation, *args, **kw):
+            with semaphore:
+                self.sent.append((schedule_id, operation, args))
+
+        def process(provider, client, schedule, data):
+            self.processed.append((schedule.id, data))
+
+        def prepare(provider, client, schedule, **kwargs):
+            return f"prepared {schedule.name}"
+
+        self.patch_provider(
+            _run_receive_operation=run_receive_operation,
+            _run_io_operation=run_io_operation,
+            _process_aircraft_data=process,
+            _prepare_aircraft_data=prepare,
+        )
+
+    def test_sync_parallel(self):
+        schedules = self.streamed | self.returned | self.failing
+        self.env["flight.data.provider"]._sync_parallel(schedules, max_workers=3)
+
+        self.assertEqual(
+            self.processed,
+            [
+                (self.streamed.id, "s1"),
+                (self.streamed.id, "s2"),
+                (self.returned.id, "r1"),
+            ],
+        )
+        self.assertCountEqual(
+            self.sent,
+            [
+                (self.streamed.id, "send", ("prepared Streamed",)),
+                (self.returned.id, "send", ("prepared Returned",)),
+            ],
+        )
+        self.assertTrue(self.streamed.last_success)
+        self.assertTrue(self.returned.last_success)
+        self.assertFalse(self.failing.last_success)
+
+        runs = self.env["flight.data.sync.run"].search(
+            [("schedule_id", "in", schedules.ids)]
+        )
+        self.assertEqual(
+            {run.schedule_id: run.state for run in runs},
+            {self.streamed: "done", self.returned: "done", self.failing: "failed"},
+        )
+
+
+class TestSyncParallelSameProvider(FlightDataSyncCase):
+    def test_streams_of_one_provider_do_not_block_each_other(self):
+        self.provider.max_concurrency = 1
+        first = self.create_schedule(name="First", chunk_size=1)
+        second = self.create_schedule(name="Second", chunk_size=1)
+        second_waiting = threading.Event()
+        processed = []
+        # Worker threads must not read records, the test cursor is not theirs
+        names = {first.id: "First", second.id: "Second"}
+
+        def stream(schedule_id):
+            for number in range(1, 5):
+                if schedule_id == second.id and number == 3:
+                    # The channel holds 2 pages, the next one waits for the
+                    # main thread, still reading the first schedule
+                    second_waiting.set()
+                yield f"{names[schedule_id]} {number}"
+
+        def run_receive_operation(provider, semaphore, schedule_id, channel, **kw):
+            if schedule_id == first.id:
+                # Let the second schedule take the semaphore first
+                second_waiting.wait(timeout=5)
+                if not semaphore.acquire(timeout=5):
+                    channel.put("error", AssertionError("Semaphore not released"))
+                    return
+                semaphore.release()
+            provider._hand_over_received(
+                semaphore, channel, lambda: stream(schedule_id)
+            )
+
+        def process(provider, client, schedule, data):
+            processed.append(data)
+
+        self.patch_provider(
+            _run_receive_operation=run_receive_operation,
+            _run_io_operation=lambda *args, **kwargs: None,
+            _process_aircraft_data=process,
+            _prepare_aircraft_data=lambda provider, client, schedule, **kw: None,
+        )
+        self.env["flight.data.provider"]._sync_parallel(first | second, max_workers=2)
+
+        self.assertEqual(
+            processed,
+            [f"First {number}" for number in range(1, 5)]
+            + [f"Second {number}" for number in range(1, 5)],
+        )
+        self.assertTrue(first.last_success)
+        self.assertTrue(second.last_success)
@@ -22,6 +22,5 @@ class FlightDataSyncWizard(models.TransientModel):
 
     def action_sync(self):
         self.ensure_one()
-        for schedule in self.schedule_ids:
-            self.provider_id._sync(schedule)
+        self.env["flight.data.provider"]._sync_schedules(self.schedule_ids)
         return {"type": "ir.actions.act_window_close"}
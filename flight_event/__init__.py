@@ -1 +1,8 @@
 from . import models
+
+from odoo import SUPERUSER_ID, api
+
+
+def post_init_hook(cr, registry):
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env["flight.flight"].search([])._update_phase_durations()
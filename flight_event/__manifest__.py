@@ -9,15 +9,17 @@
     "website": "https://github.com/OCA/server-env",
     "license": "LGPL-3",
     "category": "Industries",
-    "version": "16.0.1.0",
+    "version": "16.0.1.2",
     "depends": [
         "base",
+        "bus",
         "flight",
     ],
     "assets": {
         "web.assets_backend": [
             "flight_event/static/src/components/relative_datetimepicker/relative_datetimepicker.js",
             "flight_event/static/src/scss/flight_event_time_matrix.scss",
+            "flight_event/static/src/services/flight_event_code_service.js",
             "flight_event/static/src/components/flight_event_time_matrix_field/flight_event_time_matrix_field.js",
             "flight_event/static/src/components/flight_event_time_matrix_renderer/flight_event_time_matrix_renderer.js",
             "flight_event/static/src/components/flight_event_time_matrix_field/flight_event_time_matrix_field.xml",
@@ -29,6 +31,7 @@
         "views/flight_event_code_views.xml",
         "views/flight_event_time_views.xml",
         "views/flight_phase_views.xml",
+        "views/flight_phase_duration_views.xml",
         "views/flight_views.xml",
         "data/flight.event.code.csv",
         "data/flight.phase.csv",
@@ -37,6 +40,7 @@
     "images": [
         "static/description/banner.jpeg",
     ],
+    "post_init_hook": "post_init_hook",
     "application": False,
     "installable": True,
     "auto_install": False,
@@ -0,0 +1,6 @@
+from odoo import SUPERUSER_ID, api
+
+
+def migrate(cr, version):
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env["flight.flight"].search([])._update_phase_durations()
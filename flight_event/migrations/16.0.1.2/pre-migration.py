@@ -0,0 +1,13 @@
+def migrate(cr, version):
+    # Keep the first event time of a (flight, code, kind) before the unique
+    # constraint is added, like the phase durations already did
+    cr.execute(
+        """
+        DELETE FROM flight_event_time et
+         USING flight_event_time other
+         WHERE other.flight_id = et.flight_id
+           AND other.code_id = et.code_id
+           AND other.time_kind = et.time_kind
+           AND other.id < et.id
+        """
+    )
@@ -1,8 +1,10 @@
 # Copyright 2024 Apexive <https://apexive.com/>
 # License MIT (https://opensource.org/licenses/MIT).
-from datetime import datetime
+from odoo import _, api, fields, models, tools
+from odoo.exceptions import UserError
+from odoo.tools import split_every
 
-from odoo import api, fields, models
+from odoo.addons.flight.tools.timezone import format_relative_time, get_converter
 
 
 class FlightEventTime(models.Model):
@@ -44,6 +46,141 @@ class FlightEventTime(models.Model):
     time = fields.Datetime()
     # time = fields.Char()
     display_time = fields.Char(compute="_compute_display_time")
+    local_tz = fields.Char(
+        "Local Timezone",
+        compute="_compute_display_time_local",
+        help="Timezone of the departure or arrival aerodrome, depending on the "
+        "event code",
+    )
+    display_time_local = fields.Char(
+        "Local Time", compute="_compute_display_time_local"
+    )
+
+    _sql_constraints = [
+        (
+            "flight_code_kind_unique",
+            "unique(flight_id, code_id, time_kind)",
+            "A flight can only have one time per event code and time kind!",
+        ),
+    ]
+
+    @api.model
+    @tools.ormcache()
+    def _get_time_kinds(self):
+        return tuple(key for key, _label in self._fields["time_kind"].selection)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records.flight_id._update_phase_durations()
+        return records
+
+    def write(self, vals):
+        flights = self.flight_id
+        result = super().write(vals)
+        if {"flight_id", "code_id", "time_kind", "time"} & set(vals):
+            (flights | self.flight_id)._update_phase_durations()
+        return result
+
+    def unlink(self):
+        flights = self.flight_id
+        result = super().unlink()
+        flights.exists()._update_phase_durations()
+        return result
+
+    @api.model
+    def set_times(self, values_list, batch_size=5000):
+        """
+        Create or update event times in bulk, e.g. from OOOI feeds.
+
+        Rows are upserted on (flight, code, kind) with one INSERT ... ON
+        CONFLICT statement per batch, unchanged times are left alone, and the
+        flight locks are checked once for the whole list. Change tracking is
+        not logged.
+
+        :param values_list: list of dicts with ``flight_id``, ``code`` (event
+            code string, or ``code_id``), ``kind`` (time kind, defaults to
+            "A") and ``time`` (datetime or string in UTC)
+        :return: dict with the number of ``created``, ``updated`` and
+            ``unchanged`` event times
+        """
+        self.check_access_rights("create")
+        self.check_access_rights("write")
+
+        codes = {values["code"] for values in values_list if values.get("code")}
+        code_ids = {}
+        if codes:
+            code_ids = {
+                row["code"]: row["id"]
+                for row in self.env["flight.event.code"].search_read(
+                    [("code", "in", list(codes))], ["code"]
+                )
+            }
+            unknown = codes - set(code_ids)
+            if unknown:
+                raise UserError(
+                    _("Unknown event codes: %s") % ", ".join(sorted(unknown))
+                )
+
+        kinds = self._get_time_kinds()
+        rows = {}
+        for values in values_list:
+            kind = values.get("kind") or "A"
+            if kind not in kinds:
+                raise UserError(_("Unknown time kind: %s") % kind)
+            code_id = values.get("code_id") or code_ids.get(values.get("code"))
+            if not values.get("flight_id") or not code_id:
+                raise UserError(_("Event times need a flight and an event code."))
+            # The last time given for a key wins
+            rows[(values["flight_id"], code_id, kind)] = fields.Datetime.to_datetime(
+                values.get("time")
+            )
+
+        counts = {"created": 0, "updated": 0, "unchanged": 0}
+        flight_ids = {key[0] for key in rows}
+        if self._get_locked_flights(flight_ids):
+            raise UserError(_("You cannot modify locked flights."))
+
+        self.flush_model()
+        user_id = self.env.context.get("user_id", self.env.uid)
+        for batch in split_every(batch_size, list(rows.items())):
+            self.env.cr.execute(
+                """
+                INSERT INTO flight_event_time AS et
+                       (flight_id, code_id, time_kind, time, user_id,
+                        create_uid, create_date, write_uid, write_date)
+                SELECT flight_id, code_id, time_kind, time, %(user_id)s,
+                       %(uid)s, now() at time zone 'UTC',
+                       %(uid)s, now() at time zone 'UTC'
+                  FROM unnest(%(flight_ids)s::int[], %(code_ids)s::int[],
+                              %(kinds)s::varchar[], %(times)s::timestamp[])
+                       AS v(flight_id, code_id, time_kind, time)
+                    ON CONFLICT (flight_id, code_id, time_kind) DO UPDATE
+                   SET time = EXCLUDED.time,
+                       write_uid = EXCLUDED.write_uid,
+                       write_date = EXCLUDED.write_date
+                 WHERE et.time IS DISTINCT FROM EXCLUDED.time
+             RETURNING (xmax = 0)
+                """,
+                {
+                    "user_id": user_id,
+                    "uid": self.env.uid,
+                    "flight_ids": [key[0] for key, __ in batch],
+                    "code_ids": [key[1] for key, __ in batch],
+                    "kinds": [key[2] for key, __ in batch],
+                    "times": [time for __, time in batch],
+                },
+            )
+            results = [row[0] for row in self.env.cr.fetchall()]
+            counts["created"] += results.count(True)
+            counts["updated"] += results.count(False)
+            counts["unchanged"] += len(batch) - len(results)
+
+        self.invalidate_model()
+        self.env["flight.flight"].invalidate_model(["event_time_ids"])
+        if counts["created"] or counts["updated"]:
+            self.env["flight.flight"].browse(flight_ids)._update_phase_durations()
+        return counts
 
     @api.depends("time", "flight_id.date")
     def _compute_display_time(self):
@@ -54,15 +191,38 @@ class FlightEventTime(models.Model):
             if not record.time or not record.flight_id.date:
                 record.display_time = ""
                 continue
+            record.display_time = format_relative_time(
+                record.time, record.flight_id.date
+            )
 
-            time_str = record.time.strftime("%H:%M")
-            flight_date = datetime.combine(record.flight_id.date, datetime.min.time())
-            days = (record.time - flight_date).days
-            if days > 0:
-                time_str += f" (+{days})"
-            elif days < 0:
-                time_str += f" (-{days})"
-            record.display_time = time_str
+    @api.depends(
+        "time",
+        "flight_id.date",
+        "code_id.location",
+        "flight_id.departure_id.tz",
+        "flight_id.arrival_id.tz",
+    )
+    def _compute_display_time_local(self):
+        # Read the timezones of all flights involved at once
+        flights = self.flight_id
+        timezones = {
+            (flight.id, "departure"): flight.departure_id.tz for flight in flights
+        }
+        timezones.update(
+            {(flight.id, "arrival"): flight.arrival_id.tz for flight in flights}
+        )
+        for record in self:
+            tz_name = timezones.get(
+                (record.flight_id.id, record.code_id.location or "departure")
+            )
+            convert = get_converter(tz_name)
+            record.local_tz = tz_name or False
+            if not record.time or not record.flight_id.date or not convert:
+                record.display_time_local = ""
+                continue
+            record.display_time_local = format_relative_time(
+                convert(record.time), record.flight_id.date
+            )
 
     @api.depends("time_kind", "code_id.code", "display_time")
     def _compute_display_name(self):
@@ -108,7 +268,37 @@ class FlightEventCode(models.Model):
     name = fields.Char(required=True)
     description = fields.Char()
     sequence = fields.Integer(default=10)
+    location = fields.Selection(
+        [("departure", "Departure"), ("arrival", "Arrival")],
+        default="departure",
+        required=True,
+        help="Aerodrome whose timezone is used to display the local time",
+    )
 
     _sql_constraints = [
         ("code_unique", "unique(code)", "The event code must be unique!"),
     ]
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        codes = super().create(vals_list)
+        self._invalidate_event_codes()
+        return codes
+
+    def write(self, vals):
+        result = super().write(vals)
+        self._invalidate_event_codes()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self._invalidate_event_codes()
+        return result
+
+    @api.model
+    def _invalidate_event_codes(self):
+        self.clear_caches()
+        # Reload the event codes cached by the web clients
+        self.env["bus.bus"]._sendone(
+            "flight.event.code", "flight.event.code/invalidate", {}
+        )
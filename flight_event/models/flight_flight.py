@@ -1,4 +1,8 @@
 import json
+from collections import defaultdict
+from contextlib import contextmanager
+
+from markupsafe import Markup
 
 from odoo import api, fields, models
 
@@ -9,38 +13,73 @@ class FlightFlight(models.Model):
     event_time_ids = fields.One2many(
         "flight.event.time", "flight_id", string="Event Times", tracking=True
     )
+    phase_duration_ids = fields.One2many(
+        "flight.phase.duration", "flight_id", string="Phase Durations"
+    )
     durations = fields.Json(compute="_compute_durations", store=False)
+    departure_time_local = fields.Char(
+        "Departure (Local)",
+        compute="_compute_local_times",
+        help="First departure event time, actual if any, in the departure "
+        "aerodrome timezone",
+    )
+    arrival_time_local = fields.Char(
+        "Arrival (Local)",
+        compute="_compute_local_times",
+        help="Last arrival event time, actual if any, in the arrival aerodrome "
+        "timezone",
+    )
+
+    @api.depends(
+        "event_time_ids.display_time_local",
+        "event_time_ids.time_kind",
+        "event_time_ids.code_id.location",
+    )
+    def _compute_local_times(self):
+        # Event times of all flights are fetched, and their local times
+        # computed, together
+        for flight in self:
+            event_times = flight.event_time_ids.filtered("time")
+            departure = event_times.filtered(
+                lambda et: et.code_id.location == "departure"
+            )
+            arrival = event_times - departure
+            departure = departure.filtered(lambda et: et.time_kind == "A") or departure
+            arrival = arrival.filtered(lambda et: et.time_kind == "A") or arrival
+            flight.departure_time_local = (
+                min(departure, key=lambda et: et.time).display_time_local
+                if departure
+                else ""
+            )
+            flight.arrival_time_local = (
+                max(arrival, key=lambda et: et.time).display_time_local
+                if arrival
+                else ""
+            )
 
     @api.depends(
-        "event_time_ids.time", "event_time_ids.code_id", "event_time_ids.time_kind"
+        "phase_duration_ids.duration",
+        "phase_duration_ids.time_kind",
+        "phase_duration_ids.phase_id.name",
     )
     def _compute_durations(self):
-        Phase = self.env["flight.phase"]
-        phases = Phase.search([])
-        time_kinds = dict(self.env["flight.event.time"]._fields["time_kind"].selection)
+        phases = self.env["flight.phase"]._get_phase_definitions()
+        phase_keys = {phase.id: phase.key for phase in phases}
+        empty_durations = {
+            f"{phase.key}_{time_kind.lower()}": 0.0
+            for phase in phases
+            for time_kind in self.env["flight.event.time"]._get_time_kinds()
+        }
 
         for flight in self:
-            durations = {}
-            for phase in phases:
-                for time_kind in time_kinds:
-                    field_name = (
-                        f"{phase.name.lower().replace(' ', '_')}_{time_kind.lower()}"
-                    )
-                    start_time = flight._get_event_time(
-                        phase.start_event_code_id, time_kind
-                    )
-                    end_time = flight._get_event_time(
-                        phase.end_event_code_id, time_kind
+            durations = dict(empty_durations)
+            for phase_duration in flight.phase_duration_ids:
+                phase_key = phase_keys.get(phase_duration.phase_id.id)
+                if phase_key is not None:
+                    durations[f"{phase_key}_{phase_duration.time_kind.lower()}"] = (
+                        phase_duration.duration
                     )
 
-                    if start_time and end_time:
-                        duration = (
-                            end_time.time - start_time.time
-                        ).total_seconds() / 3600
-                        durations[field_name] = duration
-                    else:
-                        durations[field_name] = 0.0
-
             # Set specific durations
             durations["block"] = durations.get("block_a", 0.0) or durations.get(
                 "block_s", 0.0
@@ -51,6 +90,129 @@ class FlightFlight(models.Model):
 
             flight.durations = json.dumps(durations)
 
+    @api.model
+    def _get_phase_intervals(self, flight_ids, phases=None, kinds=None):
+        """
+        Return ``{(flight_id, phase_id, time_kind): (start, end)}`` for every
+        phase of the given flights that has both its start and end event time.
+
+        All event times of the flights are loaded with a single query into a
+        ``(flight_id, code_id, time_kind) -> time`` map, so the cost does not
+        depend on the number of phases or time kinds. ``phases`` is a sequence
+        of compiled phase definitions, see flight.phase._get_phase_definitions.
+        """
+        if phases is None:
+            phases = self.env["flight.phase"]._get_phase_definitions()
+        if kinds is None:
+            kinds = self.env["flight.event.time"]._get_time_kinds()
+        if not flight_ids:
+            return {}
+
+        event_times = {}
+        for row in self.env["flight.event.time"].search_read(
+            [("flight_id", "in", list(flight_ids)), ("time", "!=", False)],
+            ["flight_id", "code_id", "time_kind", "time"],
+            order="id",
+            load=None,
+        ):
+            # Keep the first record for a key, like _get_event_time does
+            event_times.setdefault(
+                (row["flight_id"], row["code_id"], row["time_kind"]), row["time"]
+            )
+
+        intervals = {}
+        for flight_id in flight_ids:
+            for phase in phases:
+                for time_kind in kinds:
+                    start_time = event_times.get(
+                        (flight_id, phase.start_code_id, time_kind)
+                    )
+                    end_time = event_times.get(
+                        (flight_id, phase.end_code_id, time_kind)
+                    )
+                    if start_time and end_time:
+                        intervals[(flight_id, phase.id, time_kind)] = (
+                            start_time,
+                            end_time,
+                        )
+        return intervals
+
+    @api.model
+    def compute_phase_durations(self, flight_ids, phases=None, kinds=None):
+        """
+        Batched phase duration computation for reports and sync code.
+
+        :param flight_ids: ids of the flights to compute durations for
+        :param phases: flight.phase recordset or ids, defaults to all phases
+        :param kinds: time kinds to compute, defaults to all time kinds
+        :return: ``{flight_id: {"<phase>_<kind>": hours}}``, phases without
+            both a start and an end event time are reported as 0.0
+        """
+        definitions = self.env["flight.phase"]._get_phase_definitions()
+        if phases is not None:
+            if not isinstance(phases, models.BaseModel):
+                phases = self.env["flight.phase"].browse(phases)
+            phase_ids = set(phases.ids)
+            definitions = [phase for phase in definitions if phase.id in phase_ids]
+        if kinds is None:
+            kinds = self.env["flight.event.time"]._get_time_kinds()
+        intervals = self._get_phase_intervals(flight_ids, definitions, kinds)
+
+        result = {}
+        for flight_id in flight_ids:
+            durations = result[flight_id] = {}
+            for phase in definitions:
+                for time_kind in kinds:
+                    interval = intervals.get((flight_id, phase.id, time_kind))
+                    durations[f"{phase.key}_{time_kind.lower()}"] = (
+                        (interval[1] - interval[0]).total_seconds() / 3600
+                        if interval
+                        else 0.0
+                    )
+        return result
+
+    def _update_phase_durations(self):
+        """Synchronise flight.phase.duration rows with the current event times"""
+        if not self:
+            return
+        PhaseDuration = self.env["flight.phase.duration"].sudo()
+        intervals = self._get_phase_intervals(self.ids)
+
+        existing = {
+            (row["flight_id"], row["phase_id"], row["time_kind"]): row
+            for row in PhaseDuration.search_read(
+                [("flight_id", "in", self.ids)],
+                ["flight_id", "phase_id", "time_kind", "start_time", "end_time"],
+                load=None,
+            )
+        }
+        to_create = []
+        for key, (start_time, end_time) in intervals.items():
+            values = {
+                "start_time": start_time,
+                "end_time": end_time,
+                "duration": (end_time - start_time).total_seconds() / 3600,
+            }
+            row = existing.pop(key, None)
+            if row is None:
+                flight_id, phase_id, time_kind = key
+                to_create.append(
+                    dict(
+                        values,
+                        flight_id=flight_id,
+                        phase_id=phase_id,
+                        time_kind=time_kind,
+                    )
+                )
+            elif (row["start_time"], row["end_time"]) != (start_time, end_time):
+                PhaseDuration.browse(row["id"]).write(values)
+
+        # Whatever is left no longer has both a start and an end event
+        if existing:
+            PhaseDuration.browse([row["id"] for row in existing.values()]).unlink()
+        if to_create:
+            PhaseDuration.create(to_create)
+
     def _get_event_time(self, code_id, time_kind):
         event_times = self.event_time_ids.filtered(
             lambda et: et.code_id == code_id and et.time_kind == time_kind
@@ -74,12 +236,66 @@ class FlightFlight(models.Model):
             flight.flight_duration = flight.get_duration("flight")
 
     block_duration = fields.Float(
-        string="Block Duration", compute="_compute_block_duration", store=False
+        string="Block Duration", compute="_compute_block_duration", store=True
     )
     flight_duration = fields.Float(
-        string="Flight Duration", compute="_compute_flight_duration", store=False
+        string="Flight Duration", compute="_compute_flight_duration", store=True
     )
 
+    event_time_matrix_changes = fields.Char(
+        compute="_compute_event_time_matrix_changes",
+        inverse="_inverse_event_time_matrix_changes",
+        help="Technical field: edits of the event time matrix widget as a JSON "
+        "list, applied with save_event_time_matrix when the flight is saved",
+    )
+
+    def _compute_event_time_matrix_changes(self):
+        self.event_time_matrix_changes = False
+
+    def _inverse_event_time_matrix_changes(self):
+        # Applied by the write of the form, in the same transaction
+        for flight in self:
+            if flight.event_time_matrix_changes:
+                flight.save_event_time_matrix(
+                    json.loads(flight.event_time_matrix_changes)
+                )
+
+    def save_event_time_matrix(self, changes):
+        """
+        Apply the edits of the event time matrix widget in one call.
+
+        :param changes: list of dicts with ``code_id``, ``kind`` and ``time``,
+            applied to every flight of the recordset
+        """
+        EventTime = self.env["flight.event.time"]
+        existing = {
+            (event_time.flight_id.id, event_time.code_id.id, event_time.time_kind): (
+                event_time
+            )
+            for event_time in EventTime.search([("flight_id", "in", self.ids)])
+        }
+        values_list = []
+        tracked = defaultdict(list)
+        for flight in self:
+            for change in changes:
+                values_list.append(dict(change, flight_id=flight.id))
+                key = (flight.id, change["code_id"], change.get("kind") or "A")
+                new_value = fields.Datetime.to_datetime(change.get("time"))
+                event_time = existing.get(key)
+                if not event_time:
+                    tracked[flight.id].append(f"Added: {change}")
+                elif event_time.time != new_value:
+                    tracked[flight.id].append(
+                        f"{event_time.display_name}: time changed from {event_time.time} to {new_value or 'None'}"
+                    )
+        EventTime.set_times(values_list)
+        if not (
+            self.env.context.get("tracking_disable")
+            or self.env.context.get("mail_notrack")
+        ):
+            self._log_event_time_changes(tracked)
+        return True
+
     def write(self, vals):
         if "event_time_ids" in vals:
             self._track_event_time_changes(vals["event_time_ids"])
@@ -87,31 +303,101 @@ class FlightFlight(models.Model):
         return result
 
     def _track_event_time_changes(self, event_time_vals):
-        for record in self:
-            changes = []
-            for command in event_time_vals:
-                if command[0] == 1:  # Update existing record
-                    event_time_id = command[1]
-                    new_values = command[2]
-                    old_event_time = self.env["flight.event.time"].browse(event_time_id)
-
-                    for field, new_value in new_values.items():
-                        old_value = old_event_time[field]
-                        if old_value != new_value:
-                            changes.append(
-                                f"{old_event_time.display_name}: {field} changed from {old_value} to {new_value or 'None'}"
-                            )
-
-                elif command[0] == 0:  # Create new record
-                    new_values = command[2]
-                    changes.append(f"Added: {new_values}")
-
-                elif command[0] == 2:  # Delete record
-                    deleted_event_time = self.env["flight.event.time"].browse(
-                        command[1]
-                    )
-                    changes.append(f"Removed: {deleted_event_time.display_name}")
+        """
+        Log the event time changes of a write on the flights' chatter.
+
+        The event times touched by the commands are read at once and the
+        messages logged in a batch. Skipped with the ``tracking_disable`` or
+        ``mail_notrack`` context keys, e.g. for imports and syncs, and deferred
+        within _defer_event_time_tracking.
+        """
+        if not self or self.env.context.get("tracking_disable"):
+            return
+        if self.env.context.get("mail_notrack"):
+            return
+
+        changes = self._get_event_time_changes(event_time_vals)
+        if not changes:
+            return
+        deferred = self.env.context.get("flight_event_time_changes")
+        if deferred is not None:
+            for flight in self:
+                deferred[flight.id].extend(changes)
+            return
+        self._log_event_time_changes(dict.fromkeys(self.ids, changes))
+
+    def _get_event_time_changes(self, event_time_vals):
+        """Describe the changes the ``event_time_ids`` commands make"""
+        old_values = self._read_event_time_old_values(event_time_vals)
+        changes = []
+        for command in event_time_vals:
+            if command[0] == 1:  # Update existing record
+                old = old_values.get(command[1])
+                if old:
+                    changes.extend(self._format_event_time_updates(old, command[2]))
+            elif command[0] == 0:  # Create new record
+                changes.append(f"Added: {command[2]}")
+            elif command[0] == 2:  # Delete record
+                old = old_values.get(command[1])
+                if old:
+                    changes.append(f"Removed: {old['display_name']}")
+        return changes
+
+    def _read_event_time_old_values(self, event_time_vals):
+        """Read the event times updated or deleted by the commands at once"""
+        EventTime = self.env["flight.event.time"]
+        updated_ids = set()
+        fnames = set()
+        for command in event_time_vals:
+            if command[0] == 1:
+                updated_ids.add(command[1])
+                fnames.update(command[2])
+            elif command[0] == 2:
+                updated_ids.add(command[1])
+        fnames = [fname for fname in fnames if fname in EventTime._fields]
+        return {
+            row["id"]: row
+            for row in EventTime.browse(updated_ids).read(
+                fnames + ["display_name"], load=None
+            )
+        }
+
+    def _format_event_time_updates(self, old, vals):
+        EventTime = self.env["flight.event.time"]
+        changes = []
+        for field, new_value in vals.items():
+            if field not in EventTime._fields:
+                continue
+            old_value = old[field]
+            cache_value = EventTime._fields[field].convert_to_cache(
+                new_value, EventTime
+            )
+            if (old_value or False) != (cache_value or False):
+                changes.append(
+                    f"{old['display_name']}: {field} changed from {old_value} to {new_value or 'None'}"
+                )
+        return changes
+
+    def _log_event_time_changes(self, changes):
+        """Log ``{flight_id: [change, ...]}`` on the flights in one batch"""
+        bodies = {
+            flight_id: Markup("Event Times Updated:<br/>")
+            + Markup("<br/>").join(flight_changes)
+            for flight_id, flight_changes in changes.items()
+            if flight_changes
+        }
+        if bodies:
+            self.browse(bodies)._message_log_batch(bodies=bodies)
+
+    @contextmanager
+    def _defer_event_time_tracking(self):
+        """
+        Collect the event time changes logged within the block and log them
+        once per flight at the end, e.g. around a multi-step import::
 
-            if changes:
-                message = "Event Times Updated:<br>" + "<br>".join(changes)
-                record.message_post(body=message)
+            with flights._defer_event_time_tracking() as flights:
+                ...
+        """
+        changes = defaultdict(list)
+        yield self.with_context(flight_event_time_changes=changes)
+        self._log_event_time_changes(changes)
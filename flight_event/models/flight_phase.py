@@ -1,6 +1,12 @@
 # Copyright 2024 Apexive <https://apexive.com/>
 # License MIT (https://opensource.org/licenses/MIT).
-from odoo import fields, models
+from collections import namedtuple
+
+from odoo import api, fields, models, tools
+
+PhaseDefinition = namedtuple(
+    "PhaseDefinition", ["id", "key", "start_code_id", "end_code_id", "sequence"]
+)
 
 
 class FlightPhase(models.Model):
@@ -11,3 +17,89 @@ class FlightPhase(models.Model):
     sequence = fields.Integer()
     start_event_code_id = fields.Many2one("flight.event.code")
     end_event_code_id = fields.Many2one("flight.event.code")
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        phases = super().create(vals_list)
+        self.clear_caches()
+        self._recompute_phase_durations()
+        return phases
+
+    def write(self, vals):
+        result = super().write(vals)
+        self.clear_caches()
+        if {"start_event_code_id", "end_event_code_id"} & set(vals):
+            self._recompute_phase_durations()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.clear_caches()
+        self._recompute_phase_durations()
+        return result
+
+    @api.model
+    @tools.ormcache()
+    def _get_phase_definitions(self):
+        """
+        Compiled phase configuration shared by all duration computations of
+        the registry, invalidated whenever a phase or an event code changes.
+        """
+        return tuple(
+            PhaseDefinition(
+                phase.id,
+                (phase.name or "").lower().replace(" ", "_"),
+                phase.start_event_code_id.id,
+                phase.end_event_code_id.id,
+                phase.sequence,
+            )
+            for phase in self.sudo().search([])
+        )
+
+    @api.model
+    def _recompute_phase_durations(self):
+        flights = self.env["flight.flight"].search([("event_time_ids", "!=", False)])
+        flights._update_phase_durations()
+
+
+class FlightPhaseDuration(models.Model):
+    """
+    Precomputed duration of a flight phase for a given time kind, maintained
+    incrementally from flight.event.time so that list views, read_group and
+    reports do not have to rebuild it on every request.
+    """
+
+    _name = "flight.phase.duration"
+    _description = "Flight Phase Duration"
+    _order = "flight_id, phase_id, time_kind"
+
+    flight_id = fields.Many2one(
+        "flight.flight", required=True, index=True, ondelete="cascade"
+    )
+    phase_id = fields.Many2one(
+        "flight.phase", required=True, index=True, ondelete="cascade"
+    )
+    time_kind = fields.Selection(
+        selection=lambda self: self.env["flight.event.time"]
+        ._fields["time_kind"]
+        .selection,
+        string="Time Kind",
+        required=True,
+        index=True,
+    )
+    start_time = fields.Datetime()
+    end_time = fields.Datetime()
+    duration = fields.Float(help="Duration in hours", group_operator="sum")
+
+    date = fields.Date(related="flight_id.date", store=True, index=True)
+    aircraft_id = fields.Many2one(
+        related="flight_id.aircraft_id", store=True, index=True
+    )
+
+    _sql_constraints = [
+        (
+            "flight_phase_kind_unique",
+            "unique(flight_id, phase_id, time_kind)",
+            "A flight can only have one duration per phase and time kind!",
+        ),
+    ]
@@ -3,6 +3,7 @@
 import { Component, onWillStart, onWillUpdateProps, useState } from "@odoo/owl";
 import { FlightEventTimeMatrixRenderer } from "@flight_event/components/flight_event_time_matrix_renderer/flight_event_time_matrix_renderer";
 import { registry } from "@web/core/registry";
+import { serializeDateTime } from "@web/core/l10n/dates";
 import { standardFieldProps } from "@web/views/fields/standard_field_props";
 import { useService } from "@web/core/utils/hooks";
 
@@ -10,9 +11,12 @@ export class FlightEventTimeMatrixField extends Component {
   setup() {
     this.orm = useService("orm");
     this.notification = useService("notification");
+    this.eventCodeService = useService("flight_event_code");
 
     this.state = useState({
       date: this.props.record.data.date,
+      // Edits of a saved flight, sent with the write of the form
+      pending: {},
     });
 
     this.activeField = this.props.record.activeFields[this.props.name];
@@ -23,15 +27,15 @@ export class FlightEventTimeMatrixField extends Component {
     ];
 
     onWillStart(async () => {
-      this.eventCodes = await this.orm.searchRead(
-        "flight.event.code",
-        [],
-        ["id", "code", "name"]
-      );
+      this.eventCodes = await this.eventCodeService.getEventCodes();
     });
 
     onWillUpdateProps((nextProps) => {
       this.state.date = nextProps.record.data.date;
+      if (!nextProps.record.isDirty) {
+        // Saved or discarded
+        this.state.pending = {};
+      }
     });
   }
 
@@ -46,6 +50,19 @@ export class FlightEventTimeMatrixField extends Component {
   async commitChange(timeKind, eventCode, value) {
     if (!value) return;
 
+    if (this.props.record.resId) {
+      this.state.pending[`${eventCode.code}|${timeKind.key}`] = {
+        code: eventCode.code,
+        code_id: eventCode.id,
+        kind: timeKind.key,
+        value,
+      };
+      await this.props.record.update({
+        event_time_matrix_changes: this.serializePendingChanges(),
+      });
+      return;
+    }
+
     const matchingRecords = this.list.records.filter(
       (record) =>
         record.data.time_kind === timeKind.key &&
@@ -73,6 +90,16 @@ export class FlightEventTimeMatrixField extends Component {
     }
     this.props.setDirty(false);
   }
+
+  serializePendingChanges() {
+    return JSON.stringify(
+      Object.values(this.state.pending).map((change) => ({
+        code_id: change.code_id,
+        kind: change.kind,
+        time: serializeDateTime(change.value),
+      }))
+    );
+  }
 }
 
 FlightEventTimeMatrixField.template = "flight_event.FlightEventTimeMatrixField";
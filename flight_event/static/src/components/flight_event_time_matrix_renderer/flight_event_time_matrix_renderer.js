@@ -15,10 +15,10 @@ export class FlightEventTimeMatrixRenderer extends Component {
   _updateProps(newProps) {
     this.timeKinds = newProps.timeKinds;
     this.eventCodes = newProps.eventCodes;
-    this.matrix = this._getMatrix(newProps.list.records);
+    this.matrix = this._getMatrix(newProps.list.records, newProps.pending);
   }
 
-  _getMatrix(records = this.list.records) {
+  _getMatrix(records = this.list.records, pending = {}) {
     // Initialize the matrix using map and fill
     const matrix = Object.fromEntries(
       this.eventCodes.map((eventCode) => [
@@ -40,6 +40,13 @@ export class FlightEventTimeMatrixRenderer extends Component {
       }
     });
 
+    // Edits not saved yet
+    Object.values(pending).forEach((change) => {
+      if (matrix[change.code] && matrix[change.code][change.kind] !== undefined) {
+        matrix[change.code][change.kind].value = change.value;
+      }
+    });
+
     return matrix;
   }
 
@@ -59,6 +66,7 @@ FlightEventTimeMatrixRenderer.template =
 
 FlightEventTimeMatrixRenderer.props = {
   list: Object,
+  pending: { type: Object, optional: true },
   eventCodes: Array,
   timeKinds: Array,
   date: DateTime,
@@ -0,0 +1,43 @@
+/** @odoo-module **/
+
+import { registry } from "@web/core/registry";
+
+/**
+ * Event codes shared by every matrix widget of the session. They are loaded
+ * once and reloaded after the server notifies a change of flight.event.code.
+ */
+export const flightEventCodeService = {
+  dependencies: ["orm", "bus_service"],
+
+  start(env, { orm, bus_service }) {
+    let eventCodes = null;
+
+    bus_service.addChannel("flight.event.code");
+    bus_service.addEventListener("notification", ({ detail: notifications }) => {
+      for (const { type } of notifications) {
+        if (type === "flight.event.code/invalidate") {
+          eventCodes = null;
+        }
+      }
+    });
+
+    return {
+      getEventCodes() {
+        if (!eventCodes) {
+          eventCodes = orm
+            .searchRead("flight.event.code", [], ["id", "code", "name"])
+            .catch((error) => {
+              eventCodes = null;
+              throw error;
+            });
+        }
+        return eventCodes;
+      },
+      invalidate() {
+        eventCodes = null;
+      },
+    };
+  },
+};
+
+registry.category("services").add("flight_event_code", flightEventCodeService);
@@ -8,7 +8,7 @@
     "website": "https://github.com/OCA/server-env",
     "license": "LGPL-3",
     "category": "Industries",
-    "version": "16.0.0.3",
+    "version": "16.0.0.4",
     "depends": [
         "base",
         "flight",
@@ -0,0 +1,9 @@
+from odoo import SUPERUSER_ID, api
+
+
+def migrate(cr, version):
+    # Flight names were first computed without the flight number override
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    flights = env["flight.flight"].search([("number_id", "!=", False)])
+    env.add_to_compute(flights._fields["name"], flights)
+    flights.flush_model(["name"])
@@ -1,14 +1,44 @@
 # Copyright 2024 Apexive <https://apexive.com/>
 # License MIT (https://opensource.org/licenses/MIT).
+import re
+
 from odoo import api, fields, models
 
+DESIGNATOR_RE = re.compile(r"^(?P<prefix>[A-Z0-9]{2}[A-Z]?)0*(?P<number>\d+[A-Z]?)$")
+
+
+def normalize_designator(text):
+    """Uppercase, drop whitespace and leading zeros: "ba 0123" -> "BA123" """
+    text = re.sub(r"\s+", "", text or "").upper()
+    if text.isdigit():
+        # A number fragment
+        return re.sub(r"^0+(?=\d)", "", text)
+    match = DESIGNATOR_RE.match(text)
+    if match:
+        return match["prefix"] + match["number"]
+    return text
+
 
 class FlightNumber(models.Model):
     _name = "flight.number"
     _description = "Flight Number"
+    _rec_names_search = ["designator"]
 
     prefix_id = fields.Many2one("flight.prefix")
     number = fields.Char()
+    designator = fields.Char(
+        compute="_compute_designator",
+        store=True,
+        index="trigram",
+        help="Normalized full flight number, e.g. BA123 for BA 0123",
+    )
+
+    @api.depends("prefix_id.name", "number")
+    def _compute_designator(self):
+        for record in self:
+            prefix = re.sub(r"\s+", "", record.prefix_id.name or "").upper()
+            number = re.sub(r"\s+", "", record.number or "").upper()
+            record.designator = prefix + (re.sub(r"^0+(?=\d)", "", number))
 
     def name_get(self):
         result = []
@@ -24,21 +54,42 @@ class FlightNumber(models.Model):
         args = args or []
         if operator == "ilike" and not (name or "").strip():
             domain = []
-        elif operator in ("ilike", "like"):
-            domain = [
-                "|",
-                ("prefix_id.name", operator, name),
-                ("number", operator, name),
-            ]
         else:
-            domain = [
-                "|",
-                ("prefix_id.name", operator, name),
-                ("number", operator, name),
-            ]
+            domain = [("designator", operator, name)]
 
         return self._search(domain + args, limit=limit, access_rights_uid=name_get_uid)
 
+    @api.model
+    def _search(
+        self,
+        domain,
+        offset=0,
+        limit=None,
+        order=None,
+        count=False,
+        access_rights_uid=None,
+    ):
+        return super()._search(
+            [self._normalize_designator_leaf(leaf) for leaf in domain],
+            offset=offset,
+            limit=limit,
+            order=order,
+            count=count,
+            access_rights_uid=access_rights_uid,
+        )
+
+    @api.model
+    def _normalize_designator_leaf(self, leaf):
+        """Normalize searched designators, so that "BA 0123" finds BA123"""
+        if (
+            isinstance(leaf, list | tuple)
+            and len(leaf) == 3
+            and leaf[0] == "designator"
+            and isinstance(leaf[2], str)
+        ):
+            return (leaf[0], leaf[1], normalize_designator(leaf[2]))
+        return leaf
+
 
 class FlightPrefix(models.Model):
     _name = "flight.prefix"